@@ -1,8 +1,20 @@
 """
 Flask Web Application for Autonomous Vehicle Charging Station
+
+For development, run `python src/app.py` to use the Werkzeug dev server.
+To serve concurrent dashboard clients, run it under gunicorn instead:
+
+    gunicorn --chdir src -k gevent -w 1 --worker-connections 1000 -b 0.0.0.0:5000 app:app
+
+Station state lives in this process, so use a single worker. The gevent
+worker keeps each /api/stream connection on a greenlet instead of a thread.
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
+from flask_orjson import OrjsonProvider
+import orjson
+import gc
+import logging
 import sys
 import os
 from pathlib import Path
@@ -20,8 +32,24 @@ from services.queue_manager import QueueManager
 from services.billing_service import BillingService
 from services.notification_service import NotificationService
 from services.reservation_service import ReservationService
+from logging_config import configure_logging
+
+logger = logging.getLogger(__name__)
+
+# Vehicle type lookup by name, accepting both upper- and lower-case spellings
+_VEHICLE_TYPE_MAP = {vt.name: vt for vt in VehicleType}
+_VEHICLE_TYPE_MAP.update({vt.name.lower(): vt for vt in VehicleType})
+
+# Column order of the rows returned by /api/queue/status
+_QKEYS = ('id', 'type', 'battery', 'priority')
+
+# Pre-encoded body of the /api/charge success response; only the duration varies
+_CHG_TMPL = b'{"success":true,"message":"Charged for %s hours"}'
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.json.sort_keys = False
+app.json.compact = True
 
 # Initialize the charging station and services (global for demo)
 station = ChargingStation("CS-001", "Downtown Tech Hub")
@@ -36,50 +64,131 @@ reservation_service = ReservationService()
 
 station.attach(notification_service)
 
+# Serialized bodies of the read-only slot/status/queue endpoints, dropped on every state change
+_response_cache = {}
+
+# Bumped on every state change; /api/stream clients wait on the condition for it to move
+state_condition = threading.Condition()
+_state_version = 0
+
+
+def mark_state_changed():
+    """Drop cached responses and wake dashboard streams after station state changes"""
+    global _state_version
+    with state_condition:
+        _response_cache.clear()
+        _state_version += 1
+        state_condition.notify_all()
+
+
+def cached_body(key, build):
+    """Return the cached JSON body for key, building and caching it on a miss.
+
+    The body is only stored if no state change happened while it was being
+    built, so a request racing mark_state_changed() cannot cache stale state.
+    """
+    body = _response_cache.get(key)
+    if body is None:
+        version = _state_version
+        body = orjson.dumps(build())
+        with state_condition:
+            if _state_version == version:
+                _response_cache[key] = body
+    return body
+
+
 # Background charging simulation
+TICK_SECONDS = 5
+charging_condition = threading.Condition()
+
+# Energy each slot delivers per tick (kWh); power ratings are fixed, so compute once
+_tick_energy = {slot: slot.power_rating * (TICK_SECONDS / 3600) for slot in station.slots}
+
+
+def wake_charger():
+    """Wake the background charger after a vehicle has been assigned to a slot"""
+    with charging_condition:
+        charging_condition.notify()
+
+
+def promote_next_queued():
+    """Move the next queued vehicle onto a free slot.
+
+    Returns:
+        (vehicle, slot) if a vehicle was assigned, None otherwise
+    """
+    next_vehicle = queue_manager.get_next_vehicle()
+    if next_vehicle is None:
+        return None
+
+    assigned_slot = station.assign_vehicle_to_slot(next_vehicle)
+    if assigned_slot is None:
+        # A concurrent add took the freed slot first; keep the vehicle queued
+        queue_manager.add_vehicle(next_vehicle)
+        return None
+
+    wake_charger()
+    return next_vehicle, assigned_slot
+
+
 def auto_charge_vehicles():
     """Continuously charge vehicles and auto-release when full"""
     while True:
-        time.sleep(5)  # Update every 5 seconds
+        # Block while the station is idle instead of polling empty slots
+        with charging_condition:
+            charging_condition.wait_for(station.get_occupied_slots)
+
+        time.sleep(TICK_SECONDS)
         
-        for slot in station.slots:
-            if slot.current_vehicle and not slot.is_available:
+        slots = station.slots
+        for slot in slots:
+            released = False
+            with slot.lock:
                 vehicle = slot.current_vehicle
+                if vehicle is None or slot.is_available:
+                    continue
                 
-                # Simulate 5 seconds of charging (convert to hours)
-                duration_hours = 5 / 3600  # 5 seconds in hours
-                power_consumed = slot.power_rating * duration_hours
+                # Simulate one tick of charging
+                power_consumed = _tick_energy[slot]
                 
                 # Charge the vehicle
                 vehicle.update_charge(power_consumed)
                 
                 # Auto-release if fully charged (>= 99%)
-                if vehicle.get_charge_percentage() >= 99.0:
-                    print(f"\n[AUTO-RELEASE] Vehicle {vehicle.vehicle_id} fully charged!")
-                    
-                    # Calculate billing
-                    charging_duration = slot.get_charging_duration()
-                    total_power = slot.power_rating * charging_duration
-                    
-                    # Generate invoice and process payment
-                    invoice = billing_service.generate_invoice(vehicle, charging_duration, total_power)
-                    billing_service.process_payment(vehicle, invoice.total_cost)
-                    
-                    print(f"[AUTO-RELEASE] Revenue: ${billing_service.total_revenue:.2f}")
-                    
-                    # Release the slot
-                    station.release_vehicle(slot)
-                    
-                    # Assign next vehicle from queue
-                    if not queue_manager.is_empty():
-                        next_vehicle = queue_manager.get_next_vehicle()
-                        assigned_slot = station.assign_vehicle_to_slot(next_vehicle)
-                        if assigned_slot:
-                            print(f"[AUTO-RELEASE] Next vehicle {next_vehicle.vehicle_id} assigned to {assigned_slot.slot_id}")
-
-# Start background thread
-charging_thread = threading.Thread(target=auto_charge_vehicles, daemon=True)
-charging_thread.start()
+                if vehicle.get_charge_percentage() < 99.0:
+                    continue
+
+                logger.info("Auto-release: vehicle %s fully charged", vehicle.vehicle_id)
+                
+                # Calculate billing
+                charging_duration = slot.get_charging_duration()
+                total_power = slot.power_rating * charging_duration
+                
+                # Generate invoice and process payment
+                invoice = billing_service.generate_invoice(vehicle, charging_duration, total_power)
+                billing_service.process_payment(vehicle, invoice.total_cost)
+                
+                logger.debug("Auto-release: revenue now $%.2f", billing_service.total_revenue)
+                
+                # Release the slot
+                released = station.release_vehicle(slot) is not None
+            
+            # Assign next vehicle from queue (outside the slot lock, as it may lock another slot)
+            promoted = promote_next_queued() if released else None
+            if promoted:
+                next_vehicle, assigned_slot = promoted
+                logger.info(
+                    "Auto-release: next vehicle %s assigned to %s",
+                    next_vehicle.vehicle_id, assigned_slot.slot_id
+                )
+
+        mark_state_changed()
+
+# Start background thread once per serving process; the Werkzeug reloader's
+# parent process only watches files and never serves requests
+if __name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+    charging_thread = threading.Thread(target=auto_charge_vehicles, daemon=True)
+    charging_thread.start()
 
 
 @app.route('/')
@@ -91,28 +200,27 @@ def index():
 @app.route('/api/station/status')
 def get_station_status():
     """Get current charging station status"""
-    status = station.get_station_status()
-    return jsonify(status)
+    body = cached_body('station_status', station.get_station_status)
+    return Response(body, mimetype='application/json')
+
+
+def build_queue_status():
+    """Build the queue status payload"""
+    entries = queue_manager.get_queued_entries()
+    
+    # One tuple per vehicle (ordered as _QKEYS) instead of one dict per vehicle
+    rows = [
+        (v.vehicle_id, v.vehicle_type.name, round(v.get_charge_percentage(), 1), priority)
+        for priority, v in entries
+    ]
+    return {'total': len(rows), 'fields': _QKEYS, 'rows': rows}
 
 
 @app.route('/api/queue/status')
 def get_queue_status():
     """Get current queue status"""
-    vehicles = queue_manager.get_all_vehicles()
-    
-    queue_data = {
-        'total': len(vehicles),
-        'vehicles': [
-            {
-                'id': v.vehicle_id,
-                'type': v.vehicle_type.name,
-                'battery': round(v.get_charge_percentage(), 1),
-                'priority': v.calculate_priority()
-            }
-            for v in vehicles
-        ]
-    }
-    return jsonify(queue_data)
+    body = cached_body('queue_status', build_queue_status)
+    return Response(body, mimetype='application/json')
 
 
 @app.route('/api/vehicle/add', methods=['POST'])
@@ -120,7 +228,10 @@ def add_vehicle():
     """Add a new vehicle to the station"""
     data = request.json
     
-    vehicle_type = VehicleType[data['type'].upper()]
+    try:
+        vehicle_type = _VEHICLE_TYPE_MAP[data['type']]
+    except KeyError:
+        vehicle_type = VehicleType[data['type'].upper()]
     battery_capacity = float(data.get('capacity', 60.0))
     current_charge = float(data.get('battery', 20.0))
     
@@ -138,6 +249,8 @@ def add_vehicle():
     slot = station.assign_vehicle_to_slot(vehicle)
     
     if slot:
+        mark_state_changed()
+        wake_charger()
         return jsonify({
             'success': True,
             'message': f'Vehicle {vehicle.vehicle_id} assigned to {slot.slot_id}',
@@ -146,6 +259,7 @@ def add_vehicle():
     else:
         # Add to queue
         position = queue_manager.add_vehicle(vehicle)
+        mark_state_changed()
         return jsonify({
             'success': True,
             'message': f'Vehicle {vehicle.vehicle_id} added to queue',
@@ -156,57 +270,58 @@ def add_vehicle():
 @app.route('/api/vehicle/remove/<vehicle_id>', methods=['POST'])
 def remove_vehicle(vehicle_id):
     """Remove a vehicle from station or queue"""
-    print(f"\n[API] Remove vehicle request for {vehicle_id}")
+    logger.debug("Remove vehicle request for %s", vehicle_id)
     
     # Try to release from slot
-    for slot in station.slots:
-        if slot.current_vehicle and slot.current_vehicle.vehicle_id == vehicle_id:
-            # Calculate charging duration and power consumed
-            duration = slot.get_charging_duration()
+    slot = station.get_slot_for_vehicle(vehicle_id)
+    if slot:
+        with slot.lock:
             vehicle = slot.current_vehicle
-            power_consumed = slot.power_rating * duration  # kWh = kW * hours
-            
-            print(f"[API] Duration: {duration:.4f}h, Power: {power_consumed:.2f}kWh")
-            
-            # Generate invoice (this also calculates cost internally)
-            invoice = billing_service.generate_invoice(vehicle, duration, power_consumed)
-            
-            print(f"[API] Invoice cost: ${invoice.total_cost:.2f}")
-            
-            # Process payment to update revenue
-            billing_service.process_payment(vehicle, invoice.total_cost)
-            
-            print(f"[API] Total revenue now: ${billing_service.total_revenue:.2f}")
-            
-            # Release vehicle from slot
-            station.release_vehicle(slot)
-            
-            # Process next vehicle in queue
-            if not queue_manager.is_empty():
-                next_vehicle = queue_manager.get_next_vehicle()
-                assigned_slot = station.assign_vehicle_to_slot(next_vehicle)
-                if assigned_slot:
-                    notification_service.send_notification(
-                        f"Vehicle {next_vehicle.vehicle_id} assigned to slot {assigned_slot.slot_id} from queue"
-                    )
-            
-            return jsonify({
-                'success': True,
-                'message': f'Vehicle {vehicle_id} released from slot',
-                'cost': invoice.total_cost,
-                'duration_hours': duration,
-                'power_consumed_kwh': power_consumed,
-                'invoice_id': invoice.invoice_id
-            })
-    
+            # The charger may have auto-released the vehicle since the lookup
+            released = vehicle is not None and vehicle.vehicle_id == vehicle_id
+            if released:
+                # Calculate charging duration and power consumed
+                duration = slot.get_charging_duration()
+                power_consumed = slot.power_rating * duration  # kWh = kW * hours
+                
+                logger.debug("Duration: %.4fh, Power: %.2fkWh", duration, power_consumed)
+                
+                # Generate invoice (this also calculates cost internally)
+                invoice = billing_service.generate_invoice(vehicle, duration, power_consumed)
+                
+                logger.debug("Invoice cost: $%.2f", invoice.total_cost)
+                
+                # Process payment to update revenue
+                billing_service.process_payment(vehicle, invoice.total_cost)
+                
+                logger.debug("Total revenue now: $%.2f", billing_service.total_revenue)
+                
+                # Release vehicle from slot
+                station.release_vehicle(slot)
+
+    if slot and released:
+        # Process next vehicle in queue
+        promoted = promote_next_queued()
+        if promoted:
+            next_vehicle, assigned_slot = promoted
+            notification_service.send_notification(
+                f"Vehicle {next_vehicle.vehicle_id} assigned to slot {assigned_slot.slot_id} from queue"
+            )
+        mark_state_changed()
+        
+        return jsonify({
+            'success': True,
+            'message': f'Vehicle {vehicle_id} released from slot',
+            'cost': invoice.total_cost,
+            'duration_hours': duration,
+            'power_consumed_kwh': power_consumed,
+            'invoice_id': invoice.invoice_id
+        })
+
     # Try to remove from queue
-    vehicle_to_remove = None
-    for _, _, vehicle in queue_manager._queue:
-        if vehicle.vehicle_id == vehicle_id:
-            vehicle_to_remove = vehicle
-            break
-    
+    vehicle_to_remove = queue_manager.find_vehicle(vehicle_id)
     if vehicle_to_remove and queue_manager.remove_vehicle(vehicle_to_remove):
+        mark_state_changed()
         return jsonify({
             'success': True,
             'message': f'Vehicle {vehicle_id} removed from queue'
@@ -225,27 +340,66 @@ def get_billing_stats():
     return jsonify(stats)
 
 
-@app.route('/api/slots')
-def get_slots():
-    """Get all charging slots with current status"""
+def build_slots():
+    """Build the per-slot status payload"""
     slots_data = []
-    for slot in station.slots:
+    slots = station.slots
+    for slot in slots:
         slot_info = {
             'id': slot.slot_id,
             'power': slot.power_rating,
             'available': slot.is_available,
             'vehicle': None
         }
-        if slot.current_vehicle:
-            battery_pct = min(slot.current_vehicle.get_charge_percentage(), 100.0)
+        vehicle = slot.current_vehicle
+        if vehicle:
+            battery_pct = min(vehicle.get_charge_percentage(), 100.0)
             slot_info['vehicle'] = {
-                'id': slot.current_vehicle.vehicle_id,
-                'type': slot.current_vehicle.vehicle_type.name,
+                'id': vehicle.vehicle_id,
+                'type': vehicle.vehicle_type.name,
                 'battery': round(battery_pct, 1)
             }
         slots_data.append(slot_info)
     
-    return jsonify(slots_data)
+    return slots_data
+
+
+@app.route('/api/slots')
+def get_slots():
+    """Get all charging slots with current status"""
+    body = cached_body('slots', build_slots)
+    return Response(body, mimetype='application/json')
+
+
+def build_state():
+    """Build the full dashboard payload pushed to /api/stream clients"""
+    return {
+        'station': station.get_station_status(),
+        'slots': build_slots(),
+        'queue': build_queue_status(),
+        'billing': billing_service.get_revenue_stats(),
+    }
+
+
+@app.route('/api/stream')
+def stream_state():
+    """Push the full dashboard state as server-sent events whenever it changes"""
+    def event_gen():
+        version = None
+        while True:
+            with state_condition:
+                # Time out periodically so a comment line can detect closed connections
+                changed = state_condition.wait_for(lambda: _state_version != version, timeout=30)
+                version = _state_version
+            if not changed:
+                yield b': keep-alive\n\n'
+                continue
+
+            # Encoded once per state change and shared by every connected client
+            body = cached_body('state', build_state)
+            yield b'data: ' + body + b'\n\n'
+
+    return Response(event_gen(), mimetype='text/event-stream')
 
 
 @app.route('/api/charge/<slot_id>', methods=['POST'])
@@ -255,12 +409,18 @@ def charge_vehicle(slot_id):
     duration = float(data.get('duration', 0.5))  # hours
     
     station.process_charging(duration)
+    mark_state_changed()
     
-    return jsonify({
-        'success': True,
-        'message': f'Charged for {duration} hours'
-    })
+    return Response(_CHG_TMPL % str(duration).encode(), mimetype='application/json')
+
+
+# Everything built at import (Flask, the routes, the station and its services)
+# lives for the whole process; move it to the permanent generation so the
+# cyclic GC stops rescanning it on every collection
+gc.freeze()
 
 
 if __name__ == '__main__':
+    # Only configure logging when run directly; under gunicorn the host owns it
+    configure_logging(logging.INFO)
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
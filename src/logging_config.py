@@ -0,0 +1,29 @@
+"""
+Logging Configuration
+Routes the station's event log (slot assignments, billing, notifications)
+to a console stream.
+"""
+
+import logging
+import sys
+from typing import Optional, TextIO
+
+
+def configure_logging(level: int = logging.INFO, stream: Optional[TextIO] = None) -> None:
+    """
+    Configure the root logger used by all station modules.
+
+    Messages below ``level`` are dropped before their arguments are
+    formatted, so batch simulations can pass ``logging.WARNING`` to skip
+    the per-event output entirely.
+
+    Args:
+        level: Minimum logging level to emit
+        stream: Stream to write to (defaults to stdout)
+    """
+    logging.basicConfig(
+        level=level,
+        format="%(message)s",
+        stream=stream if stream is not None else sys.stdout,
+        force=True,
+    )
@@ -11,6 +11,7 @@ from pathlib import Path
 src_dir = Path(__file__).parent
 sys.path.insert(0, str(src_dir))
 
+import logging
 import time
 from datetime import datetime, timedelta
 from models.vehicle import Vehicle, VehicleType
@@ -20,6 +21,7 @@ from services.queue_manager import QueueManager
 from services.billing_service import BillingService
 from services.notification_service import NotificationService
 from services.reservation_service import ReservationService
+from logging_config import configure_logging
 import io
 import contextlib
 from flask import Flask, jsonify, Response
@@ -214,6 +216,8 @@ def main():
     also run `python src/main.py console` to execute the simulation once
     on the console and then exit.
     """
+    configure_logging(logging.INFO)
+
     # Allow running the simulation directly in console mode
     if len(sys.argv) > 1 and sys.argv[1] == "console":
         try:
@@ -233,13 +237,19 @@ def main():
 
     @app.route("/simulate")
     def simulate_endpoint():
-        # Capture printed simulation output and return as plain text
+        # Capture printed and logged simulation output and return as plain text
         buf = io.StringIO()
+        handler = logging.StreamHandler(buf)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        root_logger = logging.getLogger()
+        root_logger.addHandler(handler)
         try:
             with contextlib.redirect_stdout(buf):
                 simulate_charging_scenario()
         except Exception as e:
             buf.write(f"\n\nError during simulation: {e}\n")
+        finally:
+            root_logger.removeHandler(handler)
         return Response(buf.getvalue(), mimetype="text/plain")
 
     # Run the Flask development server on port 5000
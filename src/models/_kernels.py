@@ -0,0 +1,65 @@
+"""
+Charging Kernels
+Array kernels for the station's batch charging step. Compiled with Numba
+when it is installed, with an equivalent NumPy implementation otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
+
+
+def _step_charge_numpy(
+    charge: np.ndarray,
+    capacity: np.ndarray,
+    power: np.ndarray,
+    dt: float,
+    energy: np.ndarray,
+    percentage: np.ndarray,
+) -> None:
+    """
+    Advance a batch of charging sessions by one time step, in place.
+
+    Args:
+        charge: Current charge per session in kWh, updated in place
+        capacity: Battery capacity per session in kWh
+        power: Slot power rating per session in kW
+        dt: Step duration in hours
+        energy: Output array receiving the kWh delivered per session
+        percentage: Output array receiving the new charge percentage
+    """
+    np.minimum(power * dt, capacity - charge, out=energy)
+    np.minimum(charge + energy, capacity, out=charge)
+    np.multiply(charge / capacity, 100, out=percentage)
+
+
+if njit is not None:
+    # A station has only a handful of slots, so the loop stays serial: a parallel
+    # kernel would start Numba's thread pool, which is not fork-safe. fastmath is
+    # left off so results match the scalar Vehicle arithmetic exactly.
+    @njit(cache=True)
+    def _step_charge_numba(charge, capacity, power, dt, energy, percentage):
+        """Compiled equivalent of _step_charge_numpy."""
+        for i in range(charge.shape[0]):
+            delta = min(power[i] * dt, capacity[i] - charge[i])
+            new = min(charge[i] + delta, capacity[i])
+            energy[i] = delta
+            charge[i] = new
+            percentage[i] = new / capacity[i] * 100
+
+    step_charge = _step_charge_numba
+else:
+    step_charge = _step_charge_numpy
+
+
+def warm_up() -> None:
+    """
+    Trigger JIT compilation so the first real charging step is not delayed.
+
+    Optional; without it the kernel compiles on its first call.
+    """
+    one = np.ones(1)
+    step_charge(np.zeros(1), one, one, 0.0, np.empty(1), np.empty(1))
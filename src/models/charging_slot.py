@@ -3,16 +3,43 @@ Charging Slot Model
 Represents a physical charging slot at the station.
 """
 
+import logging
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from typing import NotRequired, Optional, TypedDict
 from models.vehicle import Vehicle
 
+logger = logging.getLogger(__name__)
+
+
+class SlotStatus(TypedDict):
+    """Fixed schema of the dictionary returned by ChargingSlot.get_status."""
+    slot_id: str
+    power_rating: float
+    is_available: bool
+    total_power_consumed: float
+    current_vehicle: NotRequired[str]
+    charging_duration: NotRequired[float]
+    vehicle_charge_percentage: NotRequired[float]
+
 
 class ChargingSlot:
     """
     Represents a physical charging slot that can charge one vehicle at a time.
     """
 
+    __slots__ = (
+        "slot_id",
+        "power_rating",
+        "is_available",
+        "current_vehicle",
+        "charging_start_time",
+        "_start_mono",
+        "total_power_consumed",
+        "_lock",
+    )
+
     def __init__(self, slot_id: str, power_rating: float):
         """
         Initialize a charging slot.
@@ -25,8 +52,26 @@ class ChargingSlot:
         self.power_rating = power_rating
         self.is_available = True
         self.current_vehicle: Optional[Vehicle] = None
-        self.charging_start_time: Optional[datetime] = None
+        self.charging_start_time: Optional[datetime] = None  # Wall-clock time, for display
+        self._start_mono: Optional[float] = None  # Monotonic start, for duration maths
         self.total_power_consumed = 0.0
+        # Re-entrant so a holder of the slot lock can still release/assign this slot
+        self._lock = threading.RLock()
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Re-entrant lock guarding this slot; hold it to make a multi-step update atomic."""
+        return self._lock
+
+    def __getstate__(self) -> dict:
+        """Pickle every slot field except the lock, which cannot cross processes."""
+        return {name: getattr(self, name) for name in self.__slots__ if name != "_lock"}
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore pickled fields and give the copy its own lock."""
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._lock = threading.RLock()
 
     def assign_vehicle(self, vehicle: Vehicle) -> bool:
         """
@@ -38,15 +83,17 @@ class ChargingSlot:
         Returns:
             True if assignment successful, False if slot is occupied
         """
-        if not self.is_available:
-            return False
+        with self._lock:
+            if not self.is_available:
+                return False
 
-        self.current_vehicle = vehicle
-        self.is_available = False
-        self.charging_start_time = datetime.now()
-        vehicle.charging_start_time = self.charging_start_time
+            self.current_vehicle = vehicle
+            self.is_available = False
+            self.charging_start_time = datetime.now()
+            self._start_mono = time.monotonic()
+            vehicle.charging_start_time = self.charging_start_time
 
-        print(f"[Slot {self.slot_id}] Assigned to {vehicle.vehicle_id}")
+        logger.info("[Slot %s] Assigned to %s", self.slot_id, vehicle.vehicle_id)
         return True
 
     def release_vehicle(self) -> Optional[Vehicle]:
@@ -56,20 +103,23 @@ class ChargingSlot:
         Returns:
             The vehicle that was charging, or None if slot was empty
         """
-        if self.current_vehicle is None:
-            return None
+        with self._lock:
+            if self.current_vehicle is None:
+                return None
 
-        vehicle = self.current_vehicle
-        vehicle.charging_end_time = datetime.now()
+            vehicle = self.current_vehicle
+            vehicle.charging_end_time = datetime.now()
 
-        print(
-            f"[Slot {self.slot_id}] Released {vehicle.vehicle_id} "
-            f"after {self.get_charging_duration():.2f} hours"
-        )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "[Slot %s] Released %s after %.2f hours",
+                    self.slot_id, vehicle.vehicle_id, self.get_charging_duration()
+                )
 
-        self.current_vehicle = None
-        self.is_available = True
-        self.charging_start_time = None
+            self.current_vehicle = None
+            self.is_available = True
+            self.charging_start_time = None
+            self._start_mono = None
 
         return vehicle
 
@@ -80,11 +130,10 @@ class ChargingSlot:
         Returns:
             Charging duration in hours, or 0.0 if no vehicle is charging
         """
-        if self.charging_start_time is None:
+        if self._start_mono is None:
             return 0.0
 
-        duration = datetime.now() - self.charging_start_time
-        return duration.total_seconds() / 3600  # Convert to hours
+        return (time.monotonic() - self._start_mono) / 3600  # Convert to hours
 
     def simulate_charging(self, duration_hours: float) -> float:
         """
@@ -96,17 +145,18 @@ class ChargingSlot:
         Returns:
             Power consumed in kWh
         """
-        if self.current_vehicle is None:
-            return 0.0
+        with self._lock:
+            if self.current_vehicle is None:
+                return 0.0
 
-        # Power consumed = power rating * time
-        power_consumed = min(
-            self.power_rating * duration_hours,
-            self.current_vehicle.get_required_charge()
-        )
+            # Power consumed = power rating * time
+            power_consumed = min(
+                self.power_rating * duration_hours,
+                self.current_vehicle.get_required_charge()
+            )
 
-        self.current_vehicle.update_charge(power_consumed)
-        self.total_power_consumed += power_consumed
+            self.current_vehicle.update_charge(power_consumed)
+            self.total_power_consumed += power_consumed
 
         return power_consumed
 
@@ -122,27 +172,32 @@ class ChargingSlot:
 
         return self.current_vehicle.get_charge_percentage() >= 99.0
 
-    def get_status(self) -> dict:
+    def get_status(self) -> SlotStatus:
         """
         Get detailed status of the charging slot.
 
         Returns:
             Dictionary containing slot status information
         """
-        status = {
+        vehicle = self.current_vehicle
+        if vehicle is None:
+            return {
+                "slot_id": self.slot_id,
+                "power_rating": self.power_rating,
+                "is_available": self.is_available,
+                "total_power_consumed": self.total_power_consumed,
+            }
+
+        return {
             "slot_id": self.slot_id,
             "power_rating": self.power_rating,
             "is_available": self.is_available,
             "total_power_consumed": self.total_power_consumed,
+            "current_vehicle": vehicle.vehicle_id,
+            "charging_duration": self.get_charging_duration(),
+            "vehicle_charge_percentage": vehicle.get_charge_percentage(),
         }
 
-        if self.current_vehicle:
-            status["current_vehicle"] = self.current_vehicle.vehicle_id
-            status["charging_duration"] = self.get_charging_duration()
-            status["vehicle_charge_percentage"] = self.current_vehicle.get_charge_percentage()
-
-        return status
-
     def __str__(self) -> str:
         """String representation of the charging slot."""
         status = "Available" if self.is_available else f"Occupied by {self.current_vehicle.vehicle_id}"
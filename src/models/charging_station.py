@@ -4,12 +4,20 @@ Main class coordinating all charging operations.
 Implements Subject in the Observer pattern.
 """
 
-from typing import List, Optional
+import heapq
+import logging
+import sys
+from contextlib import ExitStack
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+import numpy as np
+from models import _kernels
 from models.charging_slot import ChargingSlot
 from models.vehicle import Vehicle
 from patterns.observer import Subject
 
+logger = logging.getLogger(__name__)
+
 
 class ChargingStation(Subject):
     """
@@ -17,6 +25,22 @@ class ChargingStation(Subject):
     Implements Observer pattern to notify vehicles and services.
     """
 
+    __slots__ = (
+        "station_id",
+        "location",
+        "slots",
+        "_vehicle_to_slot",
+        "_available_slots",
+        "_occupied_slots",
+        "_free_heap",
+        "_slot_index",
+        "_power",
+        "_occupied_mask",
+        "total_vehicles_served",
+        "total_revenue",
+        "created_at",
+    )
+
     def __init__(self, station_id: str, location: str):
         """
         Initialize the charging station.
@@ -29,6 +53,19 @@ class ChargingStation(Subject):
         self.station_id = station_id
         self.location = location
         self.slots: List[ChargingSlot] = []
+        self._vehicle_to_slot: Dict[str, ChargingSlot] = {}  # vehicle_id -> occupied slot
+        # slot_id -> slot, partitioned by availability and kept in step with assign/release
+        self._available_slots: Dict[str, ChargingSlot] = {}
+        self._occupied_slots: Dict[str, ChargingSlot] = {}
+        # Free slots ordered fastest charger first, as (-power_rating, slot_id, slot).
+        # _available_slots stays authoritative: entries for slots that are no
+        # longer in it are stale and skipped when popped
+        self._free_heap: List[Tuple[float, str, ChargingSlot]] = []
+        # Structure-of-arrays view of the slots for batch charging, indexed by
+        # position in self.slots; arrays grow by doubling as slots are added
+        self._slot_index: Dict[str, int] = {}
+        self._power = np.zeros(0)
+        self._occupied_mask = np.zeros(0, dtype=bool)
         self.total_vehicles_served = 0
         self.total_revenue = 0.0
         self.created_at = datetime.now()
@@ -40,8 +77,44 @@ class ChargingStation(Subject):
         Args:
             slot: ChargingSlot to add
         """
+        index = len(self.slots)
         self.slots.append(slot)
-        print(f"[Station {self.station_id}] Added slot {slot.slot_id}")
+        self._slot_index[slot.slot_id] = index
+        if index == len(self._power):
+            self._grow_arrays(max(4, 2 * index))
+        self._power[index] = slot.power_rating
+
+        if slot.is_available:
+            self._make_available(slot)
+        else:
+            self._occupied_slots[slot.slot_id] = slot
+            self._occupied_mask[index] = True
+        logger.info("[Station %s] Added slot %s", self.station_id, slot.slot_id)
+
+    def _grow_arrays(self, size: int) -> None:
+        """
+        Resize the per-slot arrays, keeping existing entries.
+
+        Args:
+            size: New array length
+        """
+        for name in ("_power", "_occupied_mask"):
+            old = getattr(self, name)
+            new = np.zeros(size, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _make_available(self, slot: ChargingSlot) -> None:
+        """
+        Mark a slot as free to claim.
+
+        Args:
+            slot: ChargingSlot that has no vehicle
+        """
+        # Publish to the dict before the heap, so a claimer that pops the heap
+        # entry always finds the slot there
+        self._available_slots[slot.slot_id] = slot
+        heapq.heappush(self._free_heap, (-slot.power_rating, slot.slot_id, slot))
 
     def get_available_slots(self) -> List[ChargingSlot]:
         """
@@ -50,7 +123,7 @@ class ChargingStation(Subject):
         Returns:
             List of available ChargingSlot objects
         """
-        return [slot for slot in self.slots if slot.is_available]
+        return list(self._available_slots.values())
 
     def get_occupied_slots(self) -> List[ChargingSlot]:
         """
@@ -59,7 +132,7 @@ class ChargingStation(Subject):
         Returns:
             List of occupied ChargingSlot objects
         """
-        return [slot for slot in self.slots if not slot.is_available]
+        return list(self._occupied_slots.values())
 
     def assign_vehicle_to_slot(self, vehicle: Vehicle) -> Optional[ChargingSlot]:
         """
@@ -71,21 +144,28 @@ class ChargingStation(Subject):
         Returns:
             ChargingSlot if assignment successful, None otherwise
         """
-        available_slots = self.get_available_slots()
-
-        if not available_slots:
-            self.notify(f"No slots available for vehicle {vehicle.vehicle_id}")
-            return None
-
-        # Assign to first available slot
-        slot = available_slots[0]
-        if slot.assign_vehicle(vehicle):
-            self.attach(vehicle)  # Add vehicle as observer
-            self.notify(
-                f"Vehicle {vehicle.vehicle_id} assigned to slot {slot.slot_id}"
-            )
-            return slot
+        # Claim the most powerful free slot; the dict pop() is atomic, so if another
+        # thread claimed the same slot first we get None and move on to the next one
+        while self._free_heap:
+            try:
+                _, slot_id, _ = heapq.heappop(self._free_heap)
+            except IndexError:  # Emptied by another thread
+                break
+            slot = self._available_slots.pop(slot_id, None)
+            if slot is None:
+                continue
+
+            self._occupied_slots[slot_id] = slot
+            if slot.assign_vehicle(vehicle):
+                self._vehicle_to_slot[vehicle.vehicle_id] = slot
+                self._occupied_mask[self._slot_index[slot_id]] = True
+                self.attach(vehicle)  # Add vehicle as observer
+                self.notify(
+                    f"Vehicle {vehicle.vehicle_id} assigned to slot {slot.slot_id}"
+                )
+                return slot
 
+        self.notify(f"No slots available for vehicle {vehicle.vehicle_id}")
         return None
 
     def release_vehicle(self, slot: ChargingSlot) -> Optional[Vehicle]:
@@ -101,6 +181,12 @@ class ChargingStation(Subject):
         vehicle = slot.release_vehicle()
 
         if vehicle:
+            self._vehicle_to_slot.pop(vehicle.vehicle_id, None)
+            # Clear the mask before the slot becomes claimable, so a concurrent
+            # assignment to it cannot have its mask bit cleared afterwards
+            self._occupied_mask[self._slot_index[slot.slot_id]] = False
+            self._occupied_slots.pop(slot.slot_id, None)
+            self._make_available(slot)
             self.total_vehicles_served += 1
             self.notify(
                 f"Vehicle {vehicle.vehicle_id} completed charging and released from slot {slot.slot_id}"
@@ -109,6 +195,18 @@ class ChargingStation(Subject):
 
         return vehicle
 
+    def get_slot_for_vehicle(self, vehicle_id: str) -> Optional[ChargingSlot]:
+        """
+        Find the slot a vehicle is currently charging at.
+
+        Args:
+            vehicle_id: ID of the vehicle to look up
+
+        Returns:
+            ChargingSlot occupied by the vehicle, or None if it is not charging here
+        """
+        return self._vehicle_to_slot.get(vehicle_id)
+
     def process_charging(self, duration_hours: float = 1.0) -> None:
         """
         Simulate charging process for all occupied slots.
@@ -116,24 +214,51 @@ class ChargingStation(Subject):
         Args:
             duration_hours: Duration to simulate in hours
         """
-        occupied_slots = self.get_occupied_slots()
-
-        for slot in occupied_slots:
-            power_consumed = slot.simulate_charging(duration_hours)
-            vehicle = slot.current_vehicle
+        rows = np.flatnonzero(self._occupied_mask[:len(self.slots)])
+        if rows.size == 0:
+            return
+
+        slots = self.slots
+        with ExitStack() as locks:
+            # Hold every occupied slot's lock (in slot order) from the gather to the
+            # write-back, so no concurrent charge update can land in between and be lost
+            for index in rows:
+                locks.enter_context(slots[index].lock)
+            rows = [index for index in rows.tolist() if slots[index].current_vehicle is not None]
+            vehicles = [slots[index].current_vehicle for index in rows]
+
+            # Vehicles stay the source of truth for their charge, so gather it once
+            # and compute the whole step in a single array kernel
+            new_charge = np.fromiter(
+                (vehicle.current_charge for vehicle in vehicles), dtype=float, count=len(rows)
+            )
+            capacity = np.fromiter(
+                (vehicle.battery_capacity for vehicle in vehicles), dtype=float, count=len(rows)
+            )
+            energy = np.empty(len(rows))
+            charge_pct = np.empty(len(rows))
+            _kernels.step_charge(
+                new_charge, capacity, self._power[rows], duration_hours, energy, charge_pct
+            )
 
-            if vehicle:
-                charge_pct = vehicle.get_charge_percentage()
-                self.notify(
-                    f"Slot {slot.slot_id}: Vehicle {vehicle.vehicle_id} "
-                    f"charged to {charge_pct:.1f}% ({power_consumed:.2f} kWh)"
-                )
+            results = list(zip(
+                rows, vehicles, new_charge.tolist(), energy.tolist(), charge_pct.tolist()
+            ))
+            for index, vehicle, charge, power_consumed, _ in results:
+                vehicle.current_charge = charge
+                slots[index].total_power_consumed += power_consumed
+
+        # Notify after the slot locks are released
+        for index, vehicle, _, power_consumed, pct in results:
+            slot = slots[index]
+            self.notify_lazy(
+                "Slot %s: Vehicle %s charged to %.1f%% (%.2f kWh)",
+                slot.slot_id, vehicle.vehicle_id, pct, power_consumed
+            )
 
-                # Check if charging is complete
-                if slot.is_charging_complete():
-                    self.notify(
-                        f"Vehicle {vehicle.vehicle_id} charging complete!"
-                    )
+            # Check if charging is complete
+            if pct >= 99.0:
+                self.notify_lazy("Vehicle %s charging complete!", vehicle.vehicle_id)
 
     def get_station_status(self) -> dict:
         """
@@ -143,7 +268,7 @@ class ChargingStation(Subject):
             Dictionary containing station status information
         """
         total_slots = len(self.slots)
-        available = len(self.get_available_slots())
+        available = len(self._available_slots)
         occupied = total_slots - available
 
         return {
@@ -161,23 +286,26 @@ class ChargingStation(Subject):
     def display_status(self) -> None:
         """Print the current status of the charging station."""
         status = self.get_station_status()
-        print("\n" + "=" * 60)
-        print(f"CHARGING STATION STATUS - {status['station_id']}")
-        print("=" * 60)
-        print(f"Location: {status['location']}")
-        print(f"Total Slots: {status['total_slots']}")
-        print(f"Available: {status['available_slots']} | Occupied: {status['occupied_slots']}")
-        print(f"Utilization Rate: {status['utilization_rate']:.1f}%")
-        print(f"Vehicles Served: {status['total_vehicles_served']}")
-        print(f"Total Revenue: ${status['total_revenue']:.2f}")
-        print(f"Active Observers: {status['observers_count']}")
-        print("=" * 60)
-
-        print("\nSlot Details:")
-        for slot in self.slots:
-            print(f"  {slot}")
-
-        print("\n")
+        # Build the report first and write it in one call rather than one per line
+        lines = [
+            "",
+            "=" * 60,
+            f"CHARGING STATION STATUS - {status['station_id']}",
+            "=" * 60,
+            f"Location: {status['location']}",
+            f"Total Slots: {status['total_slots']}",
+            f"Available: {status['available_slots']} | Occupied: {status['occupied_slots']}",
+            f"Utilization Rate: {status['utilization_rate']:.1f}%",
+            f"Vehicles Served: {status['total_vehicles_served']}",
+            f"Total Revenue: ${status['total_revenue']:.2f}",
+            f"Active Observers: {status['observers_count']}",
+            "=" * 60,
+            "",
+            "Slot Details:",
+        ]
+        lines.extend(f"  {slot}" for slot in self.slots)
+        lines.extend(("", "", ""))
+        sys.stdout.write("\n".join(lines))
 
     def __str__(self) -> str:
         """String representation of the charging station."""
@@ -3,11 +3,14 @@ Vehicle Model
 Represents an autonomous vehicle that can charge at the station.
 """
 
+import logging
 from enum import Enum
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 from patterns.observer import Observer
 
+logger = logging.getLogger(__name__)
+
 
 class VehicleType(Enum):
     """Enumeration of vehicle types with associated properties."""
@@ -22,12 +25,29 @@ class VehicleType(Enum):
         self.priority_modifier = priority_modifier
 
 
+# Queue priority contribution of each vehicle type
+_TYPE_FACTOR = {vt: vt.priority_modifier * 10 for vt in VehicleType}
+
+
 class Vehicle(Observer):
     """
     Represents an autonomous vehicle that needs charging.
     Implements Observer pattern to receive notifications from charging station.
     """
 
+    __slots__ = (
+        "vehicle_id",
+        "vehicle_type",
+        "_battery_capacity",
+        "_current_charge",
+        "_has_reservation",
+        "arrival_time",
+        "charging_start_time",
+        "charging_end_time",
+        "_priority",
+        "_charge_pct",
+    )
+
     def __init__(
         self,
         vehicle_id: str,
@@ -48,6 +68,8 @@ class Vehicle(Observer):
         """
         self.vehicle_id = vehicle_id
         self.vehicle_type = vehicle_type
+        self._priority: Optional[int] = None  # Cached calculate_priority result
+        self._charge_pct: Optional[float] = None  # Cached get_charge_percentage result
         self.battery_capacity = battery_capacity
         self.current_charge = current_charge
         self.has_reservation = has_reservation
@@ -55,6 +77,41 @@ class Vehicle(Observer):
         self.charging_start_time: Optional[datetime] = None
         self.charging_end_time: Optional[datetime] = None
 
+    # Priority inputs are properties so that any write invalidates the cached
+    # priority (and, for the charge inputs, the cached charge percentage)
+
+    @property
+    def battery_capacity(self) -> float:
+        """Maximum battery capacity in kWh."""
+        return self._battery_capacity
+
+    @battery_capacity.setter
+    def battery_capacity(self, value: float) -> None:
+        self._battery_capacity = value
+        self._priority = None
+        self._charge_pct = None
+
+    @property
+    def current_charge(self) -> float:
+        """Current charge level in kWh."""
+        return self._current_charge
+
+    @current_charge.setter
+    def current_charge(self, value: float) -> None:
+        self._current_charge = value
+        self._priority = None
+        self._charge_pct = None
+
+    @property
+    def has_reservation(self) -> bool:
+        """Whether the vehicle has a reservation."""
+        return self._has_reservation
+
+    @has_reservation.setter
+    def has_reservation(self, value: bool) -> None:
+        self._has_reservation = value
+        self._priority = None
+
     def get_required_charge(self) -> float:
         """
         Calculate the amount of charge needed to fill the battery.
@@ -71,7 +128,10 @@ class Vehicle(Observer):
         Returns:
             Charge percentage (0-100)
         """
-        return (self.current_charge / self.battery_capacity) * 100
+        pct = self._charge_pct
+        if pct is None:
+            pct = self._charge_pct = (self._current_charge / self._battery_capacity) * 100
+        return pct
 
     def update_charge(self, amount: float) -> None:
         """
@@ -95,16 +155,20 @@ class Vehicle(Observer):
         Returns:
             Priority score
         """
-        if self.has_reservation:
-            return 0  # Highest priority
+        if self._priority is not None:
+            return self._priority
 
-        # Lower charge percentage = higher priority
-        charge_factor = int(self.get_charge_percentage())
+        if self._has_reservation:
+            priority = 0  # Highest priority
+        else:
+            # Lower charge percentage = higher priority
+            charge_factor = int(self.get_charge_percentage())
 
-        # Vehicle type modifier
-        type_factor = self.vehicle_type.priority_modifier * 10
+            # Vehicle type modifier
+            priority = charge_factor + _TYPE_FACTOR[self.vehicle_type]
 
-        return charge_factor + type_factor
+        self._priority = priority
+        return priority
 
     def update(self, message: str) -> None:
         """
@@ -113,7 +177,20 @@ class Vehicle(Observer):
         Args:
             message: Notification message
         """
-        print(f"[Vehicle {self.vehicle_id}] Received notification: {message}")
+        logger.info("[Vehicle %s] Received notification: %s", self.vehicle_id, message)
+
+    def update_lazy(self, fmt: str, *args: Any) -> None:
+        """
+        Receive a notification, formatting it only if it will be logged.
+
+        Args:
+            fmt: %-style format string of the notification message
+            *args: Values to interpolate into fmt
+        """
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[Vehicle %s] Received notification: " + fmt, self.vehicle_id, *args
+            )
 
     def __str__(self) -> str:
         """String representation of the vehicle."""
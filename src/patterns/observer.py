@@ -3,17 +3,21 @@ Observer Pattern Implementation
 Provides base classes for implementing the Observer design pattern.
 """
 
-from abc import ABC, abstractmethod
-from typing import List
+import logging
+from typing import Any, Callable, Dict, Protocol
 
+logger = logging.getLogger(__name__)
 
-class Observer(ABC):
+
+class Observer(Protocol):
     """
-    Abstract base class for observers.
-    Observers must implement the update method to receive notifications.
+    Interface for observers.
+    Any object with an update method can observe a subject; subclassing
+    Observer is optional and also provides the default update_lazy.
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     def update(self, message: str) -> None:
         """
         Receive update from subject.
@@ -21,17 +25,82 @@ class Observer(ABC):
         Args:
             message: Notification message from the subject
         """
-        pass
+        ...
+
+    def update_lazy(self, fmt: str, *args: Any) -> None:
+        """
+        Receive an update whose message is built only when needed.
+
+        Observers that merely log the message can override this to pass
+        fmt and args straight to the logger; the default formats it once
+        and delegates to update.
+
+        Args:
+            fmt: %-style format string of the notification message
+            *args: Values to interpolate into fmt
+        """
+        self.update(fmt % args)
+
+
+def _lazy_update_for(observer: Observer) -> Callable[..., None]:
+    """Bind an observer's update_lazy, or a formatting shim for plain observers."""
+    update_lazy = getattr(observer, "update_lazy", None)
+    if update_lazy is not None:
+        return update_lazy
+
+    update = observer.update
+    return lambda fmt, *args: update(fmt % args)
 
 
 class Subject:
     """
-    Subject class that maintains a list of observers and notifies them of changes.
+    Subject class that maintains a set of observers and notifies them of changes.
     """
 
+    __slots__ = ("_observers", "_updates", "_lazy_updates")
+
     def __init__(self):
-        """Initialize the subject with an empty list of observers."""
-        self._observers: List[Observer] = []
+        """Initialize the subject with an empty set of observers."""
+        # id(observer) -> observer; a dict gives O(1) membership and keeps attach order
+        self._observers: Dict[int, Observer] = {}
+        # Update methods bound once at attach, keyed like _observers, so notify
+        # skips the per-observer attribute lookup
+        self._updates: Dict[int, Callable[[str], None]] = {}
+        self._lazy_updates: Dict[int, Callable[..., None]] = {}
+
+    def __getstate__(self) -> dict:
+        """Collect the attributes of every class in the hierarchy for pickling."""
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        # Bound methods are rebuilt on load rather than pickled
+        del state["_updates"], state["_lazy_updates"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled subject, re-keying observers by their new ids."""
+        for name, value in state.items():
+            setattr(self, name, value)
+        observers = self._observers.values()
+        self._observers = {}
+        self._updates = {}
+        self._lazy_updates = {}
+        for observer in observers:
+            self._bind(observer)
+
+    def _bind(self, observer: Observer) -> None:
+        """
+        Register an observer and pre-bind its update methods.
+
+        Args:
+            observer: Observer to register
+        """
+        key = id(observer)
+        self._observers[key] = observer
+        self._updates[key] = observer.update
+        self._lazy_updates[key] = _lazy_update_for(observer)
 
     def attach(self, observer: Observer) -> None:
         """
@@ -40,9 +109,9 @@ class Subject:
         Args:
             observer: Observer to attach
         """
-        if observer not in self._observers:
-            self._observers.append(observer)
-            print(f"Observer {observer.__class__.__name__} attached.")
+        if id(observer) not in self._observers:
+            self._bind(observer)
+            logger.info("Observer %s attached.", observer.__class__.__name__)
 
     def detach(self, observer: Observer) -> None:
         """
@@ -51,9 +120,10 @@ class Subject:
         Args:
             observer: Observer to detach
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
-            print(f"Observer {observer.__class__.__name__} detached.")
+        key = id(observer)
+        if self._observers.pop(key, None) is not None:
+            del self._updates[key], self._lazy_updates[key]
+            logger.info("Observer %s detached.", observer.__class__.__name__)
 
     def notify(self, message: str) -> None:
         """
@@ -62,6 +132,27 @@ class Subject:
         Args:
             message: Message to send to all observers
         """
-        print(f"[Subject] Notifying {len(self._observers)} observers: {message}")
-        for observer in self._observers:
-            observer.update(message)
+        if not self._observers:
+            return
+
+        logger.info("[Subject] Notifying %d observers: %s", len(self._observers), message)
+        for update in self._updates.values():
+            update(message)
+
+    def notify_lazy(self, fmt: str, *args: Any) -> None:
+        """
+        Notify all observers, deferring message formatting to each observer.
+
+        Args:
+            fmt: %-style format string of the message
+            *args: Values to interpolate into fmt
+        """
+        if not self._observers:
+            return
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[Subject] Notifying %d observers: " + fmt, len(self._observers), *args
+            )
+        for update_lazy in self._lazy_updates.values():
+            update_lazy(fmt, *args)
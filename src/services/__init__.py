@@ -3,6 +3,7 @@ from .queue_manager import QueueManager
 from .billing_service import BillingService, Invoice
 from .notification_service import NotificationService
 from .reservation_service import ReservationService, Reservation
+from .batch_simulator import simulate_many
 
 __all__ = [
     'QueueManager',
@@ -11,4 +12,5 @@ __all__ = [
     'NotificationService',
     'ReservationService',
     'Reservation',
+    'simulate_many',
 ]
@@ -3,38 +3,40 @@ Billing Service
 Handles cost calculation and payment processing for charging sessions.
 """
 
+import itertools
+import logging
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
+import numpy as np
 from models.vehicle import Vehicle, VehicleType
 
+logger = logging.getLogger(__name__)
 
+
+@dataclass(slots=True, frozen=True)
 class Invoice:
-    """Represents a billing invoice for a charging session."""
+    """
+    Represents a billing invoice for a charging session.
+
+    Attributes:
+        invoice_id: Unique identifier for the invoice
+        vehicle_id: ID of the vehicle that was charged
+        charging_duration: Duration of charging in hours
+        power_consumed: Total power consumed in kWh
+        total_cost: Total cost in currency units
+        timestamp: When the invoice was issued
+    """
 
-    def __init__(
-        self,
-        invoice_id: str,
-        vehicle_id: str,
-        charging_duration: float,
-        power_consumed: float,
-        total_cost: float,
-    ):
-        """
-        Initialize an invoice.
-
-        Args:
-            invoice_id: Unique identifier for the invoice
-            vehicle_id: ID of the vehicle that was charged
-            charging_duration: Duration of charging in hours
-            power_consumed: Total power consumed in kWh
-            total_cost: Total cost in currency units
-        """
-        self.invoice_id = invoice_id
-        self.vehicle_id = vehicle_id
-        self.charging_duration = charging_duration
-        self.power_consumed = power_consumed
-        self.total_cost = total_cost
-        self.timestamp = datetime.now()
+    invoice_id: str
+    vehicle_id: str
+    charging_duration: float
+    power_consumed: float
+    total_cost: float
+    timestamp: datetime = field(default_factory=datetime.now)
 
     def to_dict(self) -> dict:
         """Convert invoice to dictionary format."""
@@ -63,7 +65,9 @@ class BillingService:
 
     def __init__(self):
         """Initialize the billing service with default pricing configuration."""
-        self._invoice_counter = 0
+        self._invoice_numbers = itertools.count(1)  # next() is atomic, so IDs need no lock
+        self._invoices_generated = 0
+        self._lock = threading.Lock()  # Guards the invoice and revenue totals
 
         # Pricing configuration (per kWh)
         self.pricing_config: Dict[VehicleType, float] = {
@@ -78,10 +82,32 @@ class BillingService:
 
         # Peak hour multiplier (6 AM - 10 PM)
         self.peak_hour_multiplier = 1.2
+        self._peak_cache = (float("-inf"), False)  # (monotonic expiry, is peak)
 
         # Total revenue tracking
         self.total_revenue = 0.0
 
+    def is_peak_hour_now(self) -> bool:
+        """
+        Check whether the current local time falls in peak hours (6 AM - 10 PM).
+
+        The answer only changes on the hour, so it is cached until the next
+        hour boundary instead of reading the wall clock for every invoice.
+
+        Returns:
+            True if it is currently peak hours
+        """
+        expires, is_peak = self._peak_cache
+        mono = time.monotonic()
+        if mono < expires:
+            return is_peak
+
+        now = datetime.now()
+        seconds_into_hour = now.minute * 60 + now.second + now.microsecond / 1e6
+        is_peak = 6 <= now.hour < 22
+        self._peak_cache = (mono + 3600 - seconds_into_hour, is_peak)
+        return is_peak
+
     def calculate_cost(
         self,
         vehicle: Vehicle,
@@ -118,12 +144,45 @@ class BillingService:
 
         return round(total_cost, 2)
 
+    def calculate_costs(
+        self,
+        type_idx: np.ndarray,
+        power: np.ndarray,
+        peak: np.ndarray,
+        reservation: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Calculate costs for a batch of charging sessions in one pass.
+
+        Applies the same pricing as calculate_cost to each row. Rounding
+        uses NumPy's round-half-to-even on binary floats, so a row sitting
+        exactly on a half cent may differ from calculate_cost by one cent.
+
+        Args:
+            type_idx: Position of each session's vehicle type in VehicleType
+            power: Power consumed per session in kWh
+            peak: Boolean mask of sessions charged during peak hours
+            reservation: Boolean mask of sessions with a reservation
+
+        Returns:
+            Array of total costs in currency units
+        """
+        rates = np.array(
+            [self.pricing_config.get(vehicle_type, 0.30) for vehicle_type in VehicleType],
+            dtype=np.float64,
+        )
+        power_cost = rates[type_idx] * power
+        power_cost = np.where(peak, power_cost * self.peak_hour_multiplier, power_cost)
+        total_cost = power_cost + self.connection_fee
+        total_cost = np.where(reservation, total_cost * 0.95, total_cost)
+        return np.round(total_cost, 2)
+
     def generate_invoice(
         self,
         vehicle: Vehicle,
         duration: float,
         power_consumed: float,
-        is_peak_hour: bool = False,
+        is_peak_hour: Optional[bool] = None,
     ) -> Invoice:
         """
         Generate an invoice for a charging session.
@@ -133,14 +192,18 @@ class BillingService:
             duration: Charging duration in hours
             power_consumed: Total power consumed in kWh
             is_peak_hour: Whether charging occurred during peak hours
+                (defaults to whether it is peak hours now)
 
         Returns:
             Invoice object
         """
+        if is_peak_hour is None:
+            is_peak_hour = self.is_peak_hour_now()
         total_cost = self.calculate_cost(vehicle, duration, power_consumed, is_peak_hour)
 
-        self._invoice_counter += 1
-        invoice_id = f"INV-{self._invoice_counter:06d}"
+        invoice_id = f"INV-{next(self._invoice_numbers):06d}"
+        with self._lock:
+            self._invoices_generated += 1
 
         invoice = Invoice(
             invoice_id=invoice_id,
@@ -150,7 +213,7 @@ class BillingService:
             total_cost=total_cost,
         )
 
-        print(f"[BillingService] Generated {invoice}")
+        logger.info("[BillingService] Generated %s", invoice)
         return invoice
 
     def process_payment(self, vehicle: Vehicle, amount: float) -> bool:
@@ -168,13 +231,14 @@ class BillingService:
         # In a real system, this would integrate with a payment gateway
 
         if amount <= 0:
-            print(f"[BillingService] Payment failed: Invalid amount ${amount:.2f}")
+            logger.warning("[BillingService] Payment failed: Invalid amount $%.2f", amount)
             return False
 
         # Simulate successful payment
-        self.total_revenue += amount
-        print(
-            f"[BillingService] Payment processed: ${amount:.2f} from {vehicle.vehicle_id}"
+        with self._lock:
+            self.total_revenue += amount
+        logger.info(
+            "[BillingService] Payment processed: $%.2f from %s", amount, vehicle.vehicle_id
         )
         return True
 
@@ -188,9 +252,9 @@ class BillingService:
         """
         old_rate = self.pricing_config.get(vehicle_type, 0.0)
         self.pricing_config[vehicle_type] = new_rate
-        print(
-            f"[BillingService] Updated {vehicle_type.display_name} rate: "
-            f"${old_rate:.2f} -> ${new_rate:.2f} per kWh"
+        logger.info(
+            "[BillingService] Updated %s rate: $%.2f -> $%.2f per kWh",
+            vehicle_type.display_name, old_rate, new_rate
         )
 
     def get_revenue_stats(self) -> dict:
@@ -202,27 +266,39 @@ class BillingService:
         """
         return {
             "total_revenue": round(self.total_revenue, 2),
-            "invoices_generated": self._invoice_counter,
+            "invoices_generated": self._invoices_generated,
             "average_per_invoice": (
-                round(self.total_revenue / self._invoice_counter, 2)
-                if self._invoice_counter > 0
+                round(self.total_revenue / self._invoices_generated, 2)
+                if self._invoices_generated > 0
                 else 0.0
             ),
         }
 
     def display_pricing(self) -> None:
         """Display current pricing configuration."""
-        print("\n" + "=" * 60)
-        print("BILLING SERVICE - PRICING CONFIGURATION")
-        print("=" * 60)
-        print(f"Connection Fee: ${self.connection_fee:.2f}")
-        print(f"Peak Hour Multiplier: {self.peak_hour_multiplier}x")
-        print("\nRates per kWh:")
-        for vehicle_type, rate in self.pricing_config.items():
-            print(f"  {vehicle_type.display_name}: ${rate:.2f}")
-        print("\nDiscounts:")
-        print("  Reservation: 5% off total")
-        print("=" * 60 + "\n")
+        lines = [
+            "",
+            "=" * 60,
+            "BILLING SERVICE - PRICING CONFIGURATION",
+            "=" * 60,
+            f"Connection Fee: ${self.connection_fee:.2f}",
+            f"Peak Hour Multiplier: {self.peak_hour_multiplier}x",
+            "",
+            "Rates per kWh:",
+        ]
+        lines.extend(
+            f"  {vehicle_type.display_name}: ${rate:.2f}"
+            for vehicle_type, rate in self.pricing_config.items()
+        )
+        lines.extend((
+            "",
+            "Discounts:",
+            "  Reservation: 5% off total",
+            "=" * 60,
+            "",
+            "",
+        ))
+        sys.stdout.write("\n".join(lines))
 
     def __str__(self) -> str:
         """String representation of the billing service."""
@@ -4,10 +4,25 @@ Handles real-time notifications to vehicles and system administrators.
 Implements Observer pattern to receive updates from charging station.
 """
 
-from typing import List, Dict
+import logging
+import sys
+import time
+from collections import Counter, deque
+from itertools import islice
+from typing import Deque, List, NamedTuple
 from datetime import datetime
 from patterns.observer import Observer
 
+logger = logging.getLogger(__name__)
+
+
+class Notification(NamedTuple):
+    """A sent notification as recorded in the service history."""
+    timestamp: int  # Epoch nanoseconds, converted to datetime only when displayed
+    message: str
+    channel: str
+    service_id: str
+
 
 class NotificationService(Observer):
     """
@@ -15,15 +30,25 @@ class NotificationService(Observer):
     Implements Observer pattern to receive station events.
     """
 
-    def __init__(self, service_id: str):
+    __slots__ = (
+        "service_id",
+        "notification_history",
+        "notification_channels",
+        "_channel_counts",
+    )
+
+    def __init__(self, service_id: str, max_history: int = 10_000):
         """
         Initialize the notification service.
 
         Args:
             service_id: Unique identifier for this notification service
+            max_history: Number of most recent notifications to keep
         """
         self.service_id = service_id
-        self.notification_history: List[Dict] = []
+        self.notification_history: Deque[Notification] = deque(maxlen=max_history)
+        # Running per-channel totals, so statistics survive history eviction
+        self._channel_counts: Counter = Counter()
         self.notification_channels = ["push", "sms", "email"]
 
     def update(self, message: str) -> None:
@@ -44,20 +69,17 @@ class NotificationService(Observer):
             channel: Communication channel (push, sms, email)
         """
         if channel not in self.notification_channels:
-            print(f"[NotificationService] Invalid channel: {channel}")
+            logger.warning("[NotificationService] Invalid channel: %s", channel)
             return
 
-        notification = {
-            "timestamp": datetime.now(),
-            "message": message,
-            "channel": channel,
-            "service_id": self.service_id,
-        }
-
-        self.notification_history.append(notification)
+        self.notification_history.append(
+            Notification(time.time_ns(), message, channel, self.service_id)
+        )
+        self._channel_counts[channel] += 1
 
         # Simulate sending notification
-        print(f"[NotificationService] [{channel.upper()}] {message}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[NotificationService] [%s] %s", channel.upper(), message)
 
     def send_to_vehicle(self, vehicle_id: str, message: str) -> None:
         """
@@ -92,9 +114,9 @@ class NotificationService(Observer):
         Returns:
             Count of notifications
         """
-        return len(self.notification_history)
+        return sum(self._channel_counts.values())
 
-    def get_recent_notifications(self, count: int = 10) -> List[Dict]:
+    def get_recent_notifications(self, count: int = 10) -> List[Notification]:
         """
         Get the most recent notifications.
 
@@ -102,14 +124,18 @@ class NotificationService(Observer):
             count: Number of recent notifications to retrieve
 
         Returns:
-            List of recent notification dictionaries
+            List of recent Notification records, oldest first
         """
-        return self.notification_history[-count:]
+        # Walk back from the newest entry so the cost is O(count), not O(history)
+        recent = list(islice(reversed(self.notification_history), max(0, count)))
+        recent.reverse()
+        return recent
 
     def clear_history(self) -> None:
         """Clear notification history."""
         self.notification_history.clear()
-        print(f"[NotificationService] Notification history cleared")
+        self._channel_counts.clear()
+        logger.info("[NotificationService] Notification history cleared")
 
     def get_statistics(self) -> dict:
         """
@@ -118,30 +144,37 @@ class NotificationService(Observer):
         Returns:
             Dictionary containing notification statistics
         """
-        channel_counts = {}
-        for notification in self.notification_history:
-            channel = notification["channel"]
-            channel_counts[channel] = channel_counts.get(channel, 0) + 1
-
         return {
             "service_id": self.service_id,
-            "total_notifications": len(self.notification_history),
-            "channels_breakdown": channel_counts,
+            "total_notifications": self.get_notification_count(),
+            "channels_breakdown": dict(self._channel_counts),
             "available_channels": self.notification_channels,
         }
 
     def display_statistics(self) -> None:
         """Display notification statistics."""
         stats = self.get_statistics()
-        print("\n" + "=" * 60)
-        print(f"NOTIFICATION SERVICE - {stats['service_id']}")
-        print("=" * 60)
-        print(f"Total Notifications Sent: {stats['total_notifications']}")
-        print("\nBreakdown by Channel:")
-        for channel, count in stats['channels_breakdown'].items():
-            print(f"  {channel.upper()}: {count}")
-        print(f"\nAvailable Channels: {', '.join(stats['available_channels'])}")
-        print("=" * 60 + "\n")
+        lines = [
+            "",
+            "=" * 60,
+            f"NOTIFICATION SERVICE - {stats['service_id']}",
+            "=" * 60,
+            f"Total Notifications Sent: {stats['total_notifications']}",
+            "",
+            "Breakdown by Channel:",
+        ]
+        lines.extend(
+            f"  {channel.upper()}: {count}"
+            for channel, count in stats['channels_breakdown'].items()
+        )
+        lines.extend((
+            "",
+            f"Available Channels: {', '.join(stats['available_channels'])}",
+            "=" * 60,
+            "",
+            "",
+        ))
+        sys.stdout.write("\n".join(lines))
 
     def display_recent_notifications(self, count: int = 5) -> None:
         """
@@ -151,20 +184,26 @@ class NotificationService(Observer):
             count: Number of recent notifications to display
         """
         recent = self.get_recent_notifications(count)
-        print("\n" + "=" * 60)
-        print(f"RECENT NOTIFICATIONS (Last {min(count, len(recent))})")
-        print("=" * 60)
+        lines = [
+            "",
+            "=" * 60,
+            f"RECENT NOTIFICATIONS (Last {min(count, len(recent))})",
+            "=" * 60,
+        ]
 
         if not recent:
-            print("No notifications yet.")
+            lines.append("No notifications yet.")
         else:
             for notification in recent:
-                timestamp = notification['timestamp'].strftime("%H:%M:%S")
-                channel = notification['channel'].upper()
-                message = notification['message']
-                print(f"[{timestamp}] [{channel}] {message}")
-
-        print("=" * 60 + "\n")
+                timestamp = datetime.fromtimestamp(
+                    notification.timestamp / 1e9
+                ).strftime("%H:%M:%S")
+                channel = notification.channel.upper()
+                message = notification.message
+                lines.append(f"[{timestamp}] [{channel}] {message}")
+
+        lines.extend(("=" * 60, "", ""))
+        sys.stdout.write("\n".join(lines))
 
     def __str__(self) -> str:
         """String representation of the notification service."""
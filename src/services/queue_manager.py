@@ -3,22 +3,34 @@ Queue Manager Service
 Manages priority queue for vehicles waiting for charging slots.
 """
 
-import heapq
-from typing import List, Optional
+import logging
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+from sortedcontainers import SortedList
 from models.vehicle import Vehicle
 
+logger = logging.getLogger(__name__)
+
+# Queue keys pack (priority, counter) into one int as priority << _COUNTER_BITS
+# plus counter, so ordering by key is ordering by priority, then arrival
+_COUNTER_BITS = 40
+
 
 class QueueManager:
     """
     Manages a priority queue of vehicles waiting for charging slots.
-    Uses heap data structure for efficient priority-based operations.
+    Keeps vehicles in a sorted list, so the head, any vehicle's position
+    and removal are all O(log n) and status views need no sorting.
     """
 
     def __init__(self):
         """Initialize the queue manager with an empty priority queue."""
-        self._queue: List[tuple] = []  # List of (priority, counter, vehicle) tuples
+        # Packed int keys in service order; a single int compare per comparison
+        # and no tuples for the cyclic GC to track
+        self._queue = SortedList()
         self._counter = 0  # Counter to break ties and maintain FIFO for same priority
-        self._vehicle_positions = {}  # Track vehicle positions for quick lookup
+        self._by_key: Dict[int, Vehicle] = {}  # queue key -> queued vehicle
+        self._vehicle_positions: Dict[str, int] = {}  # vehicle_id -> queue key
 
     def add_vehicle(self, vehicle: Vehicle) -> int:
         """
@@ -30,15 +42,42 @@ class QueueManager:
         Returns:
             Position in the queue (0-indexed)
         """
-        priority = vehicle.calculate_priority()
-        heapq.heappush(self._queue, (priority, self._counter, vehicle))
-        self._vehicle_positions[vehicle.vehicle_id] = self._counter
+        key = (vehicle.calculate_priority() << _COUNTER_BITS) + self._counter
+        self._queue.add(key)
+        self._by_key[key] = vehicle
+        self._vehicle_positions[vehicle.vehicle_id] = key
         self._counter += 1
 
         position = self.get_queue_position(vehicle)
-        print(f"[QueueManager] Added {vehicle.vehicle_id} to queue at position {position}")
+        logger.info("[QueueManager] Added %s to queue at position %d", vehicle.vehicle_id, position)
         return position
 
+    def add_vehicles(self, vehicles: Iterable[Vehicle]) -> int:
+        """
+        Add a batch of vehicles, e.g. an arriving convoy, to the priority queue.
+
+        Equivalent to calling add_vehicle for each vehicle in order, but the
+        keys are merged into the queue in one pass and positions are not
+        looked up.
+
+        Args:
+            vehicles: Vehicles to add, in arrival order
+
+        Returns:
+            Number of vehicles added
+        """
+        keys = []
+        for vehicle in vehicles:
+            key = (vehicle.calculate_priority() << _COUNTER_BITS) + self._counter
+            keys.append(key)
+            self._by_key[key] = vehicle
+            self._vehicle_positions[vehicle.vehicle_id] = key
+            self._counter += 1
+        self._queue.update(keys)
+
+        logger.info("[QueueManager] Added %d vehicles to queue", len(keys))
+        return len(keys)
+
     def get_next_vehicle(self) -> Optional[Vehicle]:
         """
         Get and remove the next vehicle from the queue (highest priority).
@@ -49,11 +88,11 @@ class QueueManager:
         if not self._queue:
             return None
 
-        _, counter, vehicle = heapq.heappop(self._queue)
-        if vehicle.vehicle_id in self._vehicle_positions:
-            del self._vehicle_positions[vehicle.vehicle_id]
+        key = self._queue.pop(0)
+        vehicle = self._by_key.pop(key)
+        self._vehicle_positions.pop(vehicle.vehicle_id, None)
 
-        print(f"[QueueManager] Removed {vehicle.vehicle_id} from queue")
+        logger.info("[QueueManager] Removed %s from queue", vehicle.vehicle_id)
         return vehicle
 
     def peek_next_vehicle(self) -> Optional[Vehicle]:
@@ -66,7 +105,20 @@ class QueueManager:
         if not self._queue:
             return None
 
-        return self._queue[0][2]
+        return self._by_key[self._queue[0]]
+
+    def find_vehicle(self, vehicle_id: str) -> Optional[Vehicle]:
+        """
+        Look up a queued vehicle by its ID.
+
+        Args:
+            vehicle_id: ID of the vehicle to find
+
+        Returns:
+            The queued vehicle, or None if it is not in the queue
+        """
+        key = self._vehicle_positions.get(vehicle_id)
+        return self._by_key[key] if key is not None else None
 
     def get_queue_position(self, vehicle: Vehicle) -> int:
         """
@@ -78,19 +130,11 @@ class QueueManager:
         Returns:
             Position in queue (0-indexed), or -1 if not found
         """
-        if vehicle.vehicle_id not in self._vehicle_positions:
+        key = self._vehicle_positions.get(vehicle.vehicle_id)
+        if key is None:
             return -1
 
-        target_counter = self._vehicle_positions[vehicle.vehicle_id]
-
-        # Find position by counting vehicles ahead
-        position = 0
-        for priority, counter, _ in self._queue:
-            if counter == target_counter:
-                return position
-            position += 1
-
-        return -1
+        return self._queue.index(key)
 
     def remove_vehicle(self, vehicle: Vehicle) -> bool:
         """
@@ -105,16 +149,19 @@ class QueueManager:
         if vehicle.vehicle_id not in self._vehicle_positions:
             return False
 
-        # Find and remove the vehicle
-        for i, (priority, counter, v) in enumerate(self._queue):
-            if v.vehicle_id == vehicle.vehicle_id:
-                self._queue.pop(i)
-                heapq.heapify(self._queue)
-                del self._vehicle_positions[vehicle.vehicle_id]
-                print(f"[QueueManager] Removed {vehicle.vehicle_id} from queue")
-                return True
+        key = self._vehicle_positions.pop(vehicle.vehicle_id)
+        self._queue.remove(key)
+        del self._by_key[key]
 
-        return False
+        logger.info("[QueueManager] Removed %s from queue", vehicle.vehicle_id)
+        return True
+
+    def clear(self) -> None:
+        """Remove every vehicle, leaving the queue as if newly created."""
+        self._queue.clear()
+        self._by_key.clear()
+        self._vehicle_positions.clear()
+        self._counter = 0
 
     def get_queue_size(self) -> int:
         """
@@ -123,7 +170,7 @@ class QueueManager:
         Returns:
             Number of vehicles in queue
         """
-        return len(self._queue)
+        return len(self._by_key)
 
     def is_empty(self) -> bool:
         """
@@ -132,7 +179,7 @@ class QueueManager:
         Returns:
             True if queue is empty, False otherwise
         """
-        return len(self._queue) == 0
+        return self.get_queue_size() == 0
 
     def get_all_vehicles(self) -> List[Vehicle]:
         """
@@ -141,7 +188,36 @@ class QueueManager:
         Returns:
             List of vehicles sorted by priority
         """
-        return [vehicle for _, _, vehicle in sorted(self._queue)]
+        return [vehicle for _, vehicle in self.get_queued_entries()]
+
+    def get_top_k(self, k: int) -> List[Vehicle]:
+        """
+        Get the k highest-priority vehicles without removing them.
+
+        Args:
+            k: Maximum number of vehicles to return
+
+        Returns:
+            Up to k vehicles in priority order
+        """
+        return [vehicle for _, vehicle in self.get_queued_entries(limit=k)]
+
+    def get_queued_entries(self, limit: Optional[int] = None) -> List[Tuple[int, Vehicle]]:
+        """
+        Get queued vehicles with the priority they are queued under.
+
+        The priority is the one computed when the vehicle was added, so
+        status reports can show it without recalculating it per vehicle.
+
+        Args:
+            limit: Only return the first ``limit`` entries (all if None)
+
+        Returns:
+            List of (priority, vehicle) pairs in priority order
+        """
+        by_key = self._by_key
+        keys = self._queue if limit is None else self._queue.islice(0, limit)
+        return [(key >> _COUNTER_BITS, by_key[key]) for key in keys]
 
     def get_queue_status(self) -> dict:
         """
@@ -150,41 +226,50 @@ class QueueManager:
         Returns:
             Dictionary containing queue statistics
         """
-        vehicles = self.get_all_vehicles()
+        entries = self.get_queued_entries()
 
         return {
-            "queue_size": len(vehicles),
+            "queue_size": len(entries),
             "vehicles": [
                 {
                     "vehicle_id": v.vehicle_id,
                     "vehicle_type": v.vehicle_type.display_name,
                     "charge_percentage": v.get_charge_percentage(),
-                    "priority": v.calculate_priority(),
+                    "priority": priority,
                     "has_reservation": v.has_reservation,
                 }
-                for v in vehicles
+                for priority, v in entries
             ],
         }
 
-    def display_queue(self) -> None:
-        """Print the current state of the queue."""
-        print("\n" + "=" * 60)
-        print("QUEUE STATUS")
-        print("=" * 60)
-        print(f"Total vehicles in queue: {self.get_queue_size()}")
+    def display_queue(self, limit: Optional[int] = None) -> None:
+        """
+        Print the current state of the queue.
+
+        Args:
+            limit: Only list the first ``limit`` vehicles (all if None)
+        """
+        lines = [
+            "",
+            "=" * 60,
+            "QUEUE STATUS",
+            "=" * 60,
+            f"Total vehicles in queue: {self.get_queue_size()}",
+        ]
 
         if self.is_empty():
-            print("Queue is empty.")
+            lines.append("Queue is empty.")
         else:
-            print("\nVehicles in queue (priority order):")
-            for i, vehicle in enumerate(self.get_all_vehicles(), 1):
-                print(
+            lines.extend(("", "Vehicles in queue (priority order):"))
+            for i, (priority, vehicle) in enumerate(self.get_queued_entries(limit), 1):
+                lines.append(
                     f"  {i}. {vehicle.vehicle_id} - {vehicle.vehicle_type.display_name} "
                     f"(Battery: {vehicle.get_charge_percentage():.1f}%, "
-                    f"Priority: {vehicle.calculate_priority()})"
+                    f"Priority: {priority})"
                 )
 
-        print("=" * 60 + "\n")
+        lines.extend(("=" * 60, "", ""))
+        sys.stdout.write("\n".join(lines))
 
     def __str__(self) -> str:
         """String representation of the queue manager."""
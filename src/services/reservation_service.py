@@ -3,14 +3,35 @@ Reservation Service
 Manages charging slot reservations for autonomous vehicles.
 """
 
+import heapq
+import itertools
+import logging
+import sys
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+from sortedcontainers import SortedKeyList
 from models.vehicle import Vehicle
 
+logger = logging.getLogger(__name__)
+
+# How long after its reserved time a reservation stays valid
+_GRACE_PERIOD = timedelta(minutes=15)
+
 
 class Reservation:
     """Represents a charging slot reservation."""
 
+    __slots__ = (
+        "reservation_id",
+        "vehicle_id",
+        "reserved_time",
+        "duration_hours",
+        "expires_at",
+        "created_at",
+        "is_active",
+        "is_fulfilled",
+    )
+
     def __init__(
         self,
         reservation_id: str,
@@ -31,6 +52,7 @@ class Reservation:
         self.vehicle_id = vehicle_id
         self.reserved_time = reserved_time
         self.duration_hours = duration_hours
+        self.expires_at = reserved_time + _GRACE_PERIOD
         self.created_at = datetime.now()
         self.is_active = True
         self.is_fulfilled = False
@@ -42,8 +64,21 @@ class Reservation:
         Returns:
             True if expired, False otherwise
         """
-        grace_period = timedelta(minutes=15)
-        return datetime.now() > (self.reserved_time + grace_period)
+        return self.is_expired_at(datetime.now())
+
+    def is_expired_at(self, now: datetime) -> bool:
+        """
+        Check if reservation has expired as of a given time.
+
+        Lets callers checking many reservations read the clock once.
+
+        Args:
+            now: Time to check against
+
+        Returns:
+            True if expired, False otherwise
+        """
+        return now > self.expires_at
 
     def __str__(self) -> str:
         """String representation of the reservation."""
@@ -61,9 +96,18 @@ class ReservationService:
 
     def __init__(self):
         """Initialize the reservation service."""
-        self._reservation_counter = 0
+        self._reservation_numbers = itertools.count(1)  # next() is atomic, so IDs need no lock
         self.reservations: Dict[str, Reservation] = {}
         self.vehicle_reservations: Dict[str, str] = {}  # vehicle_id -> reservation_id
+        # (expiry time, reservation_id) for every reservation, earliest first;
+        # entries for reservations that are no longer active are skipped when popped
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        # Active reservations ordered by reserved time; expiry follows the same order,
+        # so the still-valid ones are always a suffix of this list
+        self._active_sorted = SortedKeyList(key=lambda r: r.reserved_time)
+        # Running totals so statistics do not rescan every reservation
+        self._active_count = 0
+        self._fulfilled_count = 0
 
     def create_reservation(
         self,
@@ -86,15 +130,14 @@ class ReservationService:
         if vehicle.vehicle_id in self.vehicle_reservations:
             existing_id = self.vehicle_reservations[vehicle.vehicle_id]
             if existing_id in self.reservations and self.reservations[existing_id].is_active:
-                print(
-                    f"[ReservationService] Vehicle {vehicle.vehicle_id} "
-                    f"already has an active reservation"
+                logger.warning(
+                    "[ReservationService] Vehicle %s already has an active reservation",
+                    vehicle.vehicle_id
                 )
                 return None
 
         # Create new reservation
-        self._reservation_counter += 1
-        reservation_id = f"RES-{self._reservation_counter:06d}"
+        reservation_id = f"RES-{next(self._reservation_numbers):06d}"
 
         reservation = Reservation(
             reservation_id=reservation_id,
@@ -105,12 +148,16 @@ class ReservationService:
 
         self.reservations[reservation_id] = reservation
         self.vehicle_reservations[vehicle.vehicle_id] = reservation_id
+        heapq.heappush(self._expiry_heap, (reservation.expires_at, reservation_id))
+        self._active_sorted.add(reservation)
+        self._active_count += 1
         vehicle.has_reservation = True
 
-        print(
-            f"[ReservationService] Created reservation {reservation_id} "
-            f"for {vehicle.vehicle_id} at {reserved_time.strftime('%Y-%m-%d %H:%M')}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[ReservationService] Created reservation %s for %s at %s",
+                reservation_id, vehicle.vehicle_id, reserved_time.strftime('%Y-%m-%d %H:%M')
+            )
         return reservation_id
 
     def cancel_reservation(self, reservation_id: str) -> bool:
@@ -124,17 +171,20 @@ class ReservationService:
             True if cancelled successfully, False if not found
         """
         if reservation_id not in self.reservations:
-            print(f"[ReservationService] Reservation {reservation_id} not found")
+            logger.warning("[ReservationService] Reservation %s not found", reservation_id)
             return False
 
         reservation = self.reservations[reservation_id]
-        reservation.is_active = False
+        if reservation.is_active:
+            reservation.is_active = False
+            self._active_sorted.remove(reservation)
+            self._active_count -= 1
 
         # Remove from vehicle reservations
         if reservation.vehicle_id in self.vehicle_reservations:
             del self.vehicle_reservations[reservation.vehicle_id]
 
-        print(f"[ReservationService] Cancelled reservation {reservation_id}")
+        logger.info("[ReservationService] Cancelled reservation %s", reservation_id)
         return True
 
     def check_reservation(self, vehicle: Vehicle) -> Optional[Reservation]:
@@ -172,10 +222,15 @@ class ReservationService:
             return False
 
         reservation = self.reservations[reservation_id]
-        reservation.is_fulfilled = True
-        reservation.is_active = False
-
-        print(f"[ReservationService] Fulfilled reservation {reservation_id}")
+        if not reservation.is_fulfilled:
+            reservation.is_fulfilled = True
+            self._fulfilled_count += 1
+        if reservation.is_active:
+            reservation.is_active = False
+            self._active_sorted.remove(reservation)
+            self._active_count -= 1
+
+        logger.info("[ReservationService] Fulfilled reservation %s", reservation_id)
         return True
 
     def cleanup_expired_reservations(self) -> int:
@@ -186,14 +241,18 @@ class ReservationService:
             Number of expired reservations removed
         """
         expired_count = 0
+        now = datetime.now()
 
-        for reservation_id, reservation in list(self.reservations.items()):
-            if reservation.is_active and reservation.is_expired():
+        # Only the reservations whose expiry time has passed are visited
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            _, reservation_id = heapq.heappop(heap)
+            if self.reservations[reservation_id].is_active:
                 self.cancel_reservation(reservation_id)
                 expired_count += 1
 
         if expired_count > 0:
-            print(f"[ReservationService] Cleaned up {expired_count} expired reservations")
+            logger.info("[ReservationService] Cleaned up %d expired reservations", expired_count)
 
         return expired_count
 
@@ -202,13 +261,11 @@ class ReservationService:
         Get all active reservations.
 
         Returns:
-            List of active Reservation objects
+            List of active Reservation objects, ordered by reserved time
         """
-        return [
-            reservation
-            for reservation in self.reservations.values()
-            if reservation.is_active and not reservation.is_expired()
-        ]
+        # Skip the expired prefix: reserved before now - grace means expired
+        start = self._active_sorted.bisect_key_left(datetime.now() - _GRACE_PERIOD)
+        return list(self._active_sorted.islice(start))
 
     def get_statistics(self) -> dict:
         """
@@ -217,36 +274,41 @@ class ReservationService:
         Returns:
             Dictionary containing reservation statistics
         """
-        active_reservations = self.get_active_reservations()
-        fulfilled_count = sum(
-            1 for r in self.reservations.values() if r.is_fulfilled
-        )
+        # Cancel anything past its grace period first, so the active count
+        # excludes expired reservations just as get_active_reservations does
+        self.cleanup_expired_reservations()
 
         return {
             "total_reservations": len(self.reservations),
-            "active_reservations": len(active_reservations),
-            "fulfilled_reservations": fulfilled_count,
+            "active_reservations": self._active_count,
+            "fulfilled_reservations": self._fulfilled_count,
         }
 
     def display_reservations(self) -> None:
         """Display all active reservations."""
         active = self.get_active_reservations()
 
-        print("\n" + "=" * 60)
-        print("ACTIVE RESERVATIONS")
-        print("=" * 60)
-        print(f"Total Active: {len(active)}")
+        lines = [
+            "",
+            "=" * 60,
+            "ACTIVE RESERVATIONS",
+            "=" * 60,
+            f"Total Active: {len(active)}",
+        ]
 
         if not active:
-            print("No active reservations.")
+            lines.append("No active reservations.")
         else:
-            print("\nReservation Details:")
-            for reservation in sorted(active, key=lambda r: r.reserved_time):
-                print(f"  {reservation}")
-                print(f"    Duration: {reservation.duration_hours} hours")
-                print(f"    Created: {reservation.created_at.strftime('%Y-%m-%d %H:%M')}")
-
-        print("=" * 60 + "\n")
+            lines.extend(("", "Reservation Details:"))
+            for reservation in active:
+                lines.extend((
+                    f"  {reservation}",
+                    f"    Duration: {reservation.duration_hours} hours",
+                    f"    Created: {reservation.created_at.strftime('%Y-%m-%d %H:%M')}",
+                ))
+
+        lines.extend(("=" * 60, "", ""))
+        sys.stdout.write("\n".join(lines))
 
     def __str__(self) -> str:
         """String representation of the reservation service."""
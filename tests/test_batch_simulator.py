@@ -0,0 +1,58 @@
+"""
+Unit tests for the batch simulator.
+Tests station pickling and parallel simulation of independent stations.
+"""
+
+import pickle
+import pytest
+
+from models.vehicle import Vehicle, VehicleType
+from models.charging_slot import ChargingSlot
+from models.charging_station import ChargingStation
+from services.batch_simulator import simulate_many
+
+
+class TestBatchSimulator:
+    """Test cases for station pickling and simulate_many."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.stations = []
+        for i in range(3):
+            station = ChargingStation(f"CS-{i:03d}", "Test Location")
+            station.add_slot(ChargingSlot("SLOT-A", 50.0))
+            station.add_slot(ChargingSlot("SLOT-B", 100.0))
+            station.assign_vehicle_to_slot(Vehicle("AV-001", VehicleType.SEDAN, 60.0, 10.0))
+            self.stations.append(station)
+        self.station = self.stations[0]
+
+    def test_station_pickle_round_trip(self):
+        """Test that a station with an occupied slot survives pickling and keeps working."""
+        copy = pickle.loads(pickle.dumps(self.station))
+
+        assert copy.get_station_status() == self.station.get_station_status()
+
+        slot = copy.get_slot_for_vehicle("AV-001")
+        released = copy.release_vehicle(slot)
+        assert released.vehicle_id == "AV-001"
+        # Observers are re-keyed on load, so the copied vehicle was detached
+        assert copy.get_station_status()["observers_count"] == 0
+
+        assert slot.assign_vehicle(Vehicle("AV-002", VehicleType.SUV, 80.0, 20.0))
+        assert slot.current_vehicle.vehicle_id == "AV-002"
+
+        # The original station is unaffected by changes to the copy
+        assert self.station.get_slot_for_vehicle("AV-001") is not None
+
+    def test_simulate_many(self):
+        """Test simulating several stations in worker processes."""
+        statuses = simulate_many(self.stations, ticks=2, dt=0.5, processes=2)
+
+        assert sorted(status["station_id"] for status in statuses) == [
+            "CS-000", "CS-001", "CS-002"
+        ]
+        assert all(status["occupied_slots"] == 1 for status in statuses)
+
+        # The caller's stations are untouched
+        vehicle = self.station.get_slot_for_vehicle("AV-001").current_vehicle
+        assert vehicle.current_charge == 10.0
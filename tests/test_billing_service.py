@@ -3,13 +3,10 @@ Unit tests for BillingService.
 Tests cost calculation, invoice generation, and payment processing.
 """
 
+import numpy as np
 import pytest
-import sys
-from pathlib import Path
-
-# Add src directory to path
-src_dir = Path(__file__).parent.parent / 'src'
-sys.path.insert(0, str(src_dir))
+from datetime import datetime
+from unittest.mock import patch
 
 from models.vehicle import Vehicle, VehicleType
 from services.billing_service import BillingService, Invoice
@@ -68,23 +65,17 @@ class TestBillingService:
         # ($6.00 + $2.00) * 0.95 (5% discount) = $7.60
         assert cost == 7.60
 
-    def test_calculate_cost_different_vehicle_types(self):
+    @pytest.mark.parametrize("vehicle_type,capacity,expected", [
+        (VehicleType.SEDAN, 60.0, 5.00),  # 10 kWh * $0.30 + $2.00
+        (VehicleType.SUV, 80.0, 5.20),    # 10 kWh * $0.32 + $2.00
+        (VehicleType.TRUCK, 100.0, 5.50), # 10 kWh * $0.35 + $2.00
+        (VehicleType.BUS, 150.0, 4.80),   # 10 kWh * $0.28 + $2.00 (fleet discount)
+    ])
+    def test_calculate_cost_different_vehicle_types(self, vehicle_type, capacity, expected):
         """Test cost calculation for different vehicle types."""
-        sedan = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
-        suv = Vehicle("AV-002", VehicleType.SUV, 80.0, 40.0)
-        truck = Vehicle("AV-003", VehicleType.TRUCK, 100.0, 50.0)
-        bus = Vehicle("AV-004", VehicleType.BUS, 150.0, 75.0)
-
-        power = 10.0
-        sedan_cost = self.billing_service.calculate_cost(sedan, 1.0, power)
-        suv_cost = self.billing_service.calculate_cost(suv, 1.0, power)
-        truck_cost = self.billing_service.calculate_cost(truck, 1.0, power)
-        bus_cost = self.billing_service.calculate_cost(bus, 1.0, power)
-
-        # Different rates should result in different costs
-        assert sedan_cost != suv_cost
-        assert suv_cost != truck_cost
-        assert truck_cost > bus_cost  # Bus has fleet discount
+        vehicle = Vehicle("AV-001", vehicle_type, capacity, capacity / 2)
+
+        assert self.billing_service.calculate_cost(vehicle, 1.0, 10.0) == expected
 
     def test_generate_invoice(self):
         """Test invoice generation."""
@@ -129,6 +120,33 @@ class TestBillingService:
 
         assert self.billing_service.total_revenue == 25.00
 
+    def test_is_peak_hour_now(self):
+        """Test that the peak-hour check is cached until the next hour boundary."""
+        with patch("services.billing_service.datetime") as mock_datetime, \
+                patch("services.billing_service.time") as mock_time:
+            mock_datetime.now.return_value = datetime(2024, 1, 1, 21, 59, 30)
+            mock_time.monotonic.return_value = 1000.0
+            assert self.billing_service.is_peak_hour_now() is True
+
+            # The clock has passed 10 PM, but the cached answer holds until the boundary
+            mock_datetime.now.return_value = datetime(2024, 1, 1, 22, 0, 0)
+            mock_time.monotonic.return_value = 1029.0
+            assert self.billing_service.is_peak_hour_now() is True
+            assert mock_datetime.now.call_count == 1
+
+            mock_time.monotonic.return_value = 1030.0
+            assert self.billing_service.is_peak_hour_now() is False
+
+    def test_generate_invoice_defaults_to_current_peak_hours(self):
+        """Test that invoices without an explicit peak flag use the current time."""
+        vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+
+        with patch.object(self.billing_service, "is_peak_hour_now", return_value=True):
+            invoice = self.billing_service.generate_invoice(vehicle, 1.0, 20.0)
+
+        # (20 kWh * $0.30 * 1.2) + $2.00 = $9.20
+        assert invoice.total_cost == 9.20
+
     def test_update_pricing(self):
         """Test updating pricing for a vehicle type."""
         old_rate = self.billing_service.pricing_config[VehicleType.SEDAN]
@@ -139,6 +157,27 @@ class TestBillingService:
         assert self.billing_service.pricing_config[VehicleType.SEDAN] == new_rate
         assert self.billing_service.pricing_config[VehicleType.SEDAN] != old_rate
 
+    def test_calculate_costs_matches_scalar(self):
+        """Test that batch cost calculation agrees with calculate_cost."""
+        types = list(VehicleType)
+        sessions = [
+            (VehicleType.SEDAN, 20.0, False, False),
+            (VehicleType.SEDAN, 20.0, True, False),
+            (VehicleType.SUV, 35.5, False, True),
+            (VehicleType.BUS, 120.0, True, True),
+        ]
+
+        costs = self.billing_service.calculate_costs(
+            np.array([types.index(vt) for vt, _, _, _ in sessions]),
+            np.array([power for _, power, _, _ in sessions]),
+            np.array([peak for _, _, peak, _ in sessions]),
+            np.array([res for _, _, _, res in sessions]),
+        )
+
+        for cost, (vehicle_type, power, peak, res) in zip(costs, sessions):
+            vehicle = Vehicle("AV-001", vehicle_type, 100.0, 0.0, has_reservation=res)
+            assert cost == self.billing_service.calculate_cost(vehicle, 1.0, power, peak)
+
     def test_get_revenue_stats(self):
         """Test getting revenue statistics."""
         vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
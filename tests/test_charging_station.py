@@ -3,16 +3,13 @@ Unit tests for ChargingStation.
 Tests station management, slot allocation, and Observer pattern.
 """
 
+import numpy as np
 import pytest
-import sys
-from pathlib import Path
-
-# Add src directory to path
-src_dir = Path(__file__).parent.parent / 'src'
-sys.path.insert(0, str(src_dir))
+import threading
 
 from models.vehicle import Vehicle, VehicleType
 from models.charging_slot import ChargingSlot
+from models import _kernels
 from models.charging_station import ChargingStation
 from services.notification_service import NotificationService
 
@@ -26,6 +23,10 @@ class TestChargingStation:
         self.station.add_slot(ChargingSlot("SLOT-A", 50.0))
         self.station.add_slot(ChargingSlot("SLOT-B", 50.0))
 
+    def test_station_has_no_instance_dict(self):
+        """Test that the station's attributes live in __slots__."""
+        assert not hasattr(self.station, "__dict__")
+
     def test_initialization(self):
         """Test charging station initialization."""
         assert self.station.station_id == "CS-001"
@@ -73,6 +74,18 @@ class TestChargingStation:
         assert slot.current_vehicle == vehicle
         assert slot.is_available is False
 
+    def test_assign_vehicle_prefers_most_powerful_slot(self):
+        """Test that vehicles get the fastest free charger, ties broken by slot ID."""
+        self.station.add_slot(ChargingSlot("SLOT-C", 150.0))
+        vehicles = [Vehicle(f"AV-{i:03d}", VehicleType.SEDAN, 60.0, 30.0) for i in range(4)]
+
+        assert self.station.assign_vehicle_to_slot(vehicles[0]).slot_id == "SLOT-C"
+        assert self.station.assign_vehicle_to_slot(vehicles[1]).slot_id == "SLOT-A"
+
+        self.station.release_vehicle(self.station.slots[2])
+        assert self.station.assign_vehicle_to_slot(vehicles[2]).slot_id == "SLOT-C"
+        assert self.station.assign_vehicle_to_slot(vehicles[3]).slot_id == "SLOT-B"
+
     def test_assign_vehicle_no_slots_available(self):
         """Test assigning vehicle when no slots are available."""
         vehicle1 = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
@@ -107,6 +120,30 @@ class TestChargingStation:
         assert released is None
         assert self.station.total_vehicles_served == 0
 
+    def test_get_slot_for_vehicle(self):
+        """Test looking up the slot a vehicle is charging at."""
+        vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        slot = self.station.assign_vehicle_to_slot(vehicle)
+
+        assert self.station.get_slot_for_vehicle("AV-001") is slot
+
+        self.station.release_vehicle(slot)
+        assert self.station.get_slot_for_vehicle("AV-001") is None
+
+    def test_slot_availability_tracks_assign_and_release(self):
+        """Test that available/occupied slots stay in step with assign and release."""
+        vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        slot = self.station.assign_vehicle_to_slot(vehicle)
+
+        assert slot in self.station.get_occupied_slots()
+        assert slot not in self.station.get_available_slots()
+        assert self.station.get_station_status()["available_slots"] == 1
+
+        self.station.release_vehicle(slot)
+        assert slot in self.station.get_available_slots()
+        assert self.station.get_occupied_slots() == []
+        assert self.station.get_station_status()["available_slots"] == 2
+
     def test_process_charging(self):
         """Test processing charging for all occupied slots."""
         vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 10.0)
@@ -117,6 +154,51 @@ class TestChargingStation:
 
         assert vehicle.current_charge > initial_charge
 
+    def test_process_charging_caps_at_capacity(self):
+        """Test that batch charging stops at full capacity and tracks energy per slot."""
+        for i in range(6):  # More slots than the initial array size
+            self.station.add_slot(ChargingSlot(f"SLOT-X{i}", 50.0))
+        vehicles = [Vehicle(f"AV-{i:03d}", VehicleType.SEDAN, 60.0, 50.0) for i in range(8)]
+        slots = [self.station.assign_vehicle_to_slot(v) for v in vehicles]
+
+        self.station.process_charging(duration_hours=1.0)
+
+        for vehicle, slot in zip(vehicles, slots):
+            assert vehicle.current_charge == 60.0
+            assert slot.total_power_consumed == 10.0
+
+        self.station.release_vehicle(slots[0])
+        self.station.process_charging(duration_hours=1.0)
+        assert slots[0].total_power_consumed == 10.0
+
+    def test_process_charging_keeps_concurrent_updates(self):
+        """Test that a charge update made under the slot lock is not overwritten."""
+        vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 10.0)
+        slot = self.station.assign_vehicle_to_slot(vehicle)
+
+        with slot.lock:
+            worker = threading.Thread(target=self.station.process_charging, args=(0.1,))
+            worker.start()
+            worker.join(timeout=0.2)  # Blocks on the slot lock held here
+            vehicle.update_charge(5.0)
+        worker.join()
+
+        assert vehicle.current_charge == 10.0 + 5.0 + 50.0 * 0.1
+
+    def test_step_charge_kernel_matches_numpy(self):
+        """Test that the active charging kernel agrees with the NumPy reference."""
+        charge = np.array([0.0, 30.0, 59.5, 100.0])
+        capacity = np.array([60.0, 60.0, 60.0, 150.0])
+        power = np.array([50.0, 150.0, 50.0, 22.0])
+        expected = [charge.copy(), np.empty(4), np.empty(4)]
+        actual = [charge.copy(), np.empty(4), np.empty(4)]
+
+        _kernels._step_charge_numpy(expected[0], capacity, power, 0.25, expected[1], expected[2])
+        _kernels.step_charge(actual[0], capacity, power, 0.25, actual[1], actual[2])
+
+        for exp, act in zip(expected, actual):
+            assert act.tolist() == exp.tolist()
+
     def test_observer_pattern_attach(self):
         """Test attaching observers to the station."""
         notification_service = NotificationService("NS-001")
@@ -136,6 +218,19 @@ class TestChargingStation:
 
         assert len(self.station._observers) == initial_count - 1
 
+    def test_observer_pattern_attach_is_idempotent(self):
+        """Test that attaching the same observer twice registers it once."""
+        notification_service = NotificationService("NS-001")
+        initial_count = len(self.station._observers)
+
+        self.station.attach(notification_service)
+        self.station.attach(notification_service)
+        assert len(self.station._observers) == initial_count + 1
+
+        self.station.detach(notification_service)
+        self.station.detach(notification_service)
+        assert len(self.station._observers) == initial_count
+
     def test_observer_pattern_notify(self):
         """Test notifying observers."""
         notification_service = NotificationService("NS-001")
@@ -146,6 +241,33 @@ class TestChargingStation:
 
         assert notification_service.get_notification_count() > initial_notifications
 
+    def test_observer_pattern_notify_lazy(self):
+        """Test that lazily formatted notifications reach observers fully formatted."""
+        notification_service = NotificationService("NS-001")
+        self.station.attach(notification_service)
+
+        self.station.notify_lazy("Slot %s at %.1f%%", "SLOT-A", 42.25)
+
+        recent = notification_service.get_recent_notifications(1)
+        assert recent[0].message == "Slot SLOT-A at 42.2%"
+
+    def test_observer_pattern_accepts_structural_observer(self):
+        """Test that any object with an update method can observe the station."""
+        class Recorder:
+            def __init__(self):
+                self.messages = []
+
+            def update(self, message):
+                self.messages.append(message)
+
+        recorder = Recorder()
+        self.station.attach(recorder)
+
+        self.station.notify("plain")
+        self.station.notify_lazy("Slot %s", "SLOT-A")
+
+        assert recorder.messages == ["plain", "Slot SLOT-A"]
+
     def test_get_station_status(self):
         """Test getting station status."""
         status = self.station.get_station_status()
@@ -0,0 +1,54 @@
+"""
+Unit tests for NotificationService.
+Tests notification history and channel statistics.
+"""
+
+import pytest
+import time
+
+from services.notification_service import NotificationService
+
+
+class TestNotificationService:
+    """Test cases for NotificationService class."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.service = NotificationService("NS-001", max_history=3)
+
+    def test_recent_notifications_in_order(self):
+        """Test that recent notifications are returned oldest first."""
+        for i in range(3):
+            self.service.send_notification(f"msg {i}")
+
+        recent = self.service.get_recent_notifications(2)
+        assert [n.message for n in recent] == ["msg 1", "msg 2"]
+
+    def test_timestamp_is_epoch_nanoseconds(self):
+        """Test that notifications are stamped with integer epoch nanoseconds."""
+        before = time.time_ns()
+        self.service.send_notification("msg")
+
+        timestamp = self.service.get_recent_notifications(1)[0].timestamp
+        assert isinstance(timestamp, int)
+        assert before <= timestamp <= time.time_ns()
+
+    def test_history_is_bounded(self):
+        """Test that old notifications are evicted but still counted."""
+        for i in range(5):
+            self.service.send_notification(f"msg {i}", "sms" if i % 2 else "push")
+
+        assert len(self.service.notification_history) == 3
+        assert self.service.get_recent_notifications(10)[0].message == "msg 2"
+
+        stats = self.service.get_statistics()
+        assert stats["total_notifications"] == 5
+        assert stats["channels_breakdown"] == {"push": 3, "sms": 2}
+
+    def test_clear_history(self):
+        """Test that clearing history also resets statistics."""
+        self.service.send_notification("msg")
+        self.service.clear_history()
+
+        assert self.service.get_recent_notifications() == []
+        assert self.service.get_notification_count() == 0
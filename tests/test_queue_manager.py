@@ -4,12 +4,6 @@ Tests priority queue functionality and vehicle management.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add src directory to path
-src_dir = Path(__file__).parent.parent / 'src'
-sys.path.insert(0, str(src_dir))
 
 from models.vehicle import Vehicle, VehicleType
 from services.queue_manager import QueueManager
@@ -18,9 +12,15 @@ from services.queue_manager import QueueManager
 class TestQueueManager:
     """Test suite for QueueManager class."""
 
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def shared_queue_manager(cls):
+        """Create one QueueManager for the whole class."""
+        cls.queue_manager = QueueManager()
+
     def setup_method(self):
         """Set up test fixtures before each test method."""
-        self.queue_manager = QueueManager()
+        self.queue_manager.clear()
 
     def test_initialization(self):
         """Test queue manager initialization."""
@@ -36,6 +36,23 @@ class TestQueueManager:
         assert self.queue_manager.get_queue_size() == 1
         assert self.queue_manager.is_empty() is False
 
+    def test_add_vehicles_matches_individual_adds(self):
+        """Test that a bulk add queues vehicles exactly as one-by-one adds would."""
+        charges = [30.0, 10.0, 50.0, 10.0]
+        convoy = [Vehicle(f"AV-{i:03d}", VehicleType.SEDAN, 60.0, c) for i, c in enumerate(charges)]
+        single = QueueManager()
+        single.add_vehicle(Vehicle("AV-100", VehicleType.SEDAN, 60.0, 10.0))
+        self.queue_manager.add_vehicle(Vehicle("AV-100", VehicleType.SEDAN, 60.0, 10.0))
+
+        for vehicle in convoy:
+            single.add_vehicle(vehicle)
+        assert self.queue_manager.add_vehicles(convoy) == 4
+
+        assert self.queue_manager.get_queue_size() == 5
+        assert [v.vehicle_id for v in self.queue_manager.get_all_vehicles()] == \
+            [v.vehicle_id for v in single.get_all_vehicles()]
+        assert self.queue_manager.get_queue_position(convoy[3]) == 2
+
     def test_priority_ordering(self):
         """Test that vehicles are ordered by priority."""
         # Create vehicles with different charge levels
@@ -70,6 +87,16 @@ class TestQueueManager:
         assert next_vehicle.vehicle_id == "AV-002"
         assert next_vehicle.has_reservation is True
 
+    def test_equal_priority_is_first_come_first_served(self):
+        """Test that vehicles with the same priority leave in arrival order."""
+        vehicles = [Vehicle(f"AV-{i:03d}", VehicleType.SEDAN, 60.0, 30.0) for i in range(3)]
+        reserved = Vehicle("AV-009", VehicleType.SEDAN, 60.0, 30.0, has_reservation=True)
+        for vehicle in vehicles + [reserved]:
+            self.queue_manager.add_vehicle(vehicle)
+
+        order = [self.queue_manager.get_next_vehicle().vehicle_id for _ in range(4)]
+        assert order == ["AV-009", "AV-000", "AV-001", "AV-002"]
+
     def test_get_next_vehicle_empty_queue(self):
         """Test getting next vehicle from empty queue."""
         next_vehicle = self.queue_manager.get_next_vehicle()
@@ -96,12 +123,51 @@ class TestQueueManager:
         assert result is True
         assert self.queue_manager.get_queue_size() == 1
 
+    def test_removed_vehicle_is_skipped(self):
+        """Test that a removed vehicle is never returned from the queue."""
+        vehicle1 = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 10.0)  # Highest priority
+        vehicle2 = Vehicle("AV-002", VehicleType.SEDAN, 60.0, 30.0)
+
+        self.queue_manager.add_vehicle(vehicle1)
+        self.queue_manager.add_vehicle(vehicle2)
+        self.queue_manager.remove_vehicle(vehicle1)
+
+        assert self.queue_manager.get_queue_position(vehicle2) == 0
+        assert self.queue_manager.peek_next_vehicle().vehicle_id == "AV-002"
+        assert self.queue_manager.get_next_vehicle().vehicle_id == "AV-002"
+        assert self.queue_manager.get_next_vehicle() is None
+        assert self.queue_manager.is_empty() is True
+
+    def test_clear(self):
+        """Test that clearing empties the queue and restarts arrival order."""
+        vehicle1 = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        vehicle2 = Vehicle("AV-002", VehicleType.SEDAN, 60.0, 30.0)
+        self.queue_manager.add_vehicle(vehicle1)
+
+        self.queue_manager.clear()
+
+        assert self.queue_manager.is_empty() is True
+        assert self.queue_manager.find_vehicle("AV-001") is None
+        assert self.queue_manager.get_queue_position(vehicle1) == -1
+        assert self.queue_manager.add_vehicle(vehicle2) == 0
+
     def test_remove_nonexistent_vehicle(self):
         """Test removing a vehicle that's not in the queue."""
         vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
         result = self.queue_manager.remove_vehicle(vehicle)
         assert result is False
 
+    def test_find_vehicle(self):
+        """Test looking up a queued vehicle by ID."""
+        vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        self.queue_manager.add_vehicle(vehicle)
+
+        assert self.queue_manager.find_vehicle("AV-001") is vehicle
+        assert self.queue_manager.find_vehicle("AV-999") is None
+
+        self.queue_manager.remove_vehicle(vehicle)
+        assert self.queue_manager.find_vehicle("AV-001") is None
+
     def test_get_queue_position(self):
         """Test getting position of a vehicle in the queue."""
         vehicle1 = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 50.0)  # Low priority
@@ -118,6 +184,24 @@ class TestQueueManager:
         position1 = self.queue_manager.get_queue_position(vehicle1)
         assert position1 == 1
 
+    def test_get_queue_position_after_removal(self):
+        """Test that positions stay in priority order as vehicles come and go."""
+        vehicles = [
+            Vehicle(f"AV-{i:03d}", VehicleType.SEDAN, 60.0, charge)
+            for i, charge in enumerate([40.0, 10.0, 30.0, 20.0, 10.0])
+        ]
+        for vehicle in vehicles:
+            self.queue_manager.add_vehicle(vehicle)
+
+        self.queue_manager.remove_vehicle(vehicles[3])
+
+        positions = [self.queue_manager.get_queue_position(v) for v in vehicles]
+        assert positions == [3, 0, 2, -1, 1]
+
+        self.queue_manager.get_next_vehicle()
+        assert self.queue_manager.get_queue_position(vehicles[4]) == 0
+        assert self.queue_manager.get_queue_position(vehicles[0]) == 2
+
     def test_get_all_vehicles(self):
         """Test getting all vehicles in priority order."""
         vehicle1 = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
@@ -130,6 +214,38 @@ class TestQueueManager:
         assert len(all_vehicles) == 2
         assert all_vehicles[0].vehicle_id == "AV-002"  # Higher priority first
 
+    def test_get_top_k(self):
+        """Test getting the highest-priority vehicles without removing them."""
+        vehicles = [
+            Vehicle(f"AV-{i:03d}", VehicleType.SEDAN, 60.0, charge)
+            for i, charge in enumerate([40.0, 10.0, 30.0, 20.0])
+        ]
+        for vehicle in vehicles:
+            self.queue_manager.add_vehicle(vehicle)
+        self.queue_manager.remove_vehicle(vehicles[1])
+
+        top = self.queue_manager.get_top_k(2)
+        assert [v.vehicle_id for v in top] == ["AV-003", "AV-002"]
+        assert self.queue_manager.get_top_k(10) == self.queue_manager.get_all_vehicles()
+        assert self.queue_manager.get_queue_size() == 3
+
+    def test_get_queued_entries(self):
+        """Test that queued entries pair each vehicle with its queue priority."""
+        vehicle1 = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        vehicle2 = Vehicle("AV-002", VehicleType.SEDAN, 60.0, 10.0)
+
+        self.queue_manager.add_vehicle(vehicle1)
+        self.queue_manager.add_vehicle(vehicle2)
+
+        entries = self.queue_manager.get_queued_entries()
+        assert entries == [
+            (vehicle2.calculate_priority(), vehicle2),
+            (vehicle1.calculate_priority(), vehicle1),
+        ]
+
+        status = self.queue_manager.get_queue_status()
+        assert [v["priority"] for v in status["vehicles"]] == [p for p, _ in entries]
+
     def test_vehicle_type_priority(self):
         """Test that vehicle type affects priority."""
         sedan = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
@@ -142,6 +258,28 @@ class TestQueueManager:
         next_vehicle = self.queue_manager.get_next_vehicle()
         assert next_vehicle.vehicle_id in ["AV-001", "AV-002"]
 
+    def test_priority_cache_invalidated_on_change(self):
+        """Test that the cached priority tracks charge and reservation updates."""
+        vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        assert vehicle.calculate_priority() == 60  # 50% + sedan modifier
+
+        vehicle.update_charge(15.0)
+        assert vehicle.calculate_priority() == 85
+
+        vehicle.has_reservation = True
+        assert vehicle.calculate_priority() == 0
+
+    def test_charge_percentage_tracks_charge_updates(self):
+        """Test that the cached charge percentage follows charge and capacity changes."""
+        vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        assert vehicle.get_charge_percentage() == 50.0
+
+        vehicle.update_charge(15.0)
+        assert vehicle.get_charge_percentage() == 75.0
+
+        vehicle.battery_capacity = 90.0
+        assert vehicle.get_charge_percentage() == 50.0
+
     def test_queue_status(self):
         """Test getting queue status information."""
         vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
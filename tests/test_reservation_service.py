@@ -0,0 +1,122 @@
+"""
+Unit tests for ReservationService.
+Tests reservation lifecycle and expiry cleanup.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from models.vehicle import Vehicle, VehicleType
+from services.reservation_service import ReservationService
+
+
+class TestReservationService:
+    """Test suite for ReservationService class."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.service = ReservationService()
+        self.now = datetime.now()
+
+    def test_create_reservation(self):
+        """Test creating a reservation marks the vehicle as reserved."""
+        vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        reservation_id = self.service.create_reservation(vehicle, self.now + timedelta(hours=1))
+
+        assert reservation_id is not None
+        assert vehicle.has_reservation is True
+        assert self.service.check_reservation(vehicle).reservation_id == reservation_id
+
+    def test_reservation_has_no_instance_dict(self):
+        """Test that a reservation's attributes live in __slots__."""
+        vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        reservation_id = self.service.create_reservation(vehicle, self.now)
+
+        assert not hasattr(self.service.reservations[reservation_id], "__dict__")
+
+    def test_duplicate_reservation_rejected(self):
+        """Test that a vehicle cannot hold two active reservations."""
+        vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        self.service.create_reservation(vehicle, self.now + timedelta(hours=1))
+
+        assert self.service.create_reservation(vehicle, self.now + timedelta(hours=2)) is None
+
+    def test_reservation_expiry(self):
+        """Test that a reservation expires once its grace period has passed."""
+        vehicle = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        reservation_id = self.service.create_reservation(vehicle, self.now)
+        reservation = self.service.reservations[reservation_id]
+
+        assert reservation.is_expired_at(self.now + timedelta(minutes=15)) is False
+        assert reservation.is_expired_at(self.now + timedelta(minutes=16)) is True
+        assert reservation.is_expired() is False
+
+    def test_get_active_reservations_excludes_expired(self):
+        """Test that expired reservations are not listed as active."""
+        expired = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        upcoming = Vehicle("AV-002", VehicleType.SEDAN, 60.0, 30.0)
+        self.service.create_reservation(expired, self.now - timedelta(hours=1))
+        upcoming_id = self.service.create_reservation(upcoming, self.now + timedelta(hours=1))
+
+        active = self.service.get_active_reservations()
+        assert [r.reservation_id for r in active] == [upcoming_id]
+
+    def test_get_active_reservations_ordered_by_time(self):
+        """Test that active reservations are listed by reserved time."""
+        offsets = [3, 1, 2]
+        vehicles = [Vehicle(f"AV-{i:03d}", VehicleType.SEDAN, 60.0, 30.0) for i in range(3)]
+        ids = [
+            self.service.create_reservation(v, self.now + timedelta(hours=h))
+            for v, h in zip(vehicles, offsets)
+        ]
+        self.service.cancel_reservation(ids[2])
+
+        active = self.service.get_active_reservations()
+        assert [r.reservation_id for r in active] == [ids[1], ids[0]]
+
+    def test_cleanup_expired_reservations(self):
+        """Test that only reservations past their grace period are cancelled."""
+        expired = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        upcoming = Vehicle("AV-002", VehicleType.SEDAN, 60.0, 30.0)
+        expired_id = self.service.create_reservation(expired, self.now - timedelta(hours=1))
+        upcoming_id = self.service.create_reservation(upcoming, self.now + timedelta(hours=1))
+
+        assert self.service.cleanup_expired_reservations() == 1
+        assert self.service.reservations[expired_id].is_active is False
+        assert self.service.reservations[upcoming_id].is_active is True
+
+        # Already-cleaned reservations are not counted again
+        assert self.service.cleanup_expired_reservations() == 0
+
+    def test_get_statistics(self):
+        """Test that statistics track active, fulfilled and expired reservations."""
+        vehicles = [Vehicle(f"AV-{i:03d}", VehicleType.SEDAN, 60.0, 30.0) for i in range(4)]
+        ids = [
+            self.service.create_reservation(vehicles[0], self.now + timedelta(hours=1)),
+            self.service.create_reservation(vehicles[1], self.now + timedelta(hours=2)),
+            self.service.create_reservation(vehicles[2], self.now + timedelta(hours=3)),
+            self.service.create_reservation(vehicles[3], self.now - timedelta(hours=1)),
+        ]
+        self.service.fulfill_reservation(ids[0])
+        self.service.cancel_reservation(ids[1])
+        self.service.cancel_reservation(ids[1])  # Repeated cancel is not double counted
+
+        stats = self.service.get_statistics()
+        assert stats == {
+            "total_reservations": 4,
+            "active_reservations": len(self.service.get_active_reservations()),
+            "fulfilled_reservations": 1,
+        }
+        assert stats["active_reservations"] == 1
+
+    def test_cleanup_skips_inactive_reservations(self):
+        """Test that cancelled or fulfilled reservations are not counted as expired."""
+        cancelled = Vehicle("AV-001", VehicleType.SEDAN, 60.0, 30.0)
+        fulfilled = Vehicle("AV-002", VehicleType.SEDAN, 60.0, 30.0)
+        cancelled_id = self.service.create_reservation(cancelled, self.now - timedelta(hours=2))
+        fulfilled_id = self.service.create_reservation(fulfilled, self.now - timedelta(hours=1))
+
+        self.service.cancel_reservation(cancelled_id)
+        self.service.fulfill_reservation(fulfilled_id)
+
+        assert self.service.cleanup_expired_reservations() == 0